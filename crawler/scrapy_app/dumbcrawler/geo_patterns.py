@@ -36,6 +36,14 @@ DEFINITION_PATTERN = re.compile(
     re.IGNORECASE
 )
 
+# A definition lies within one run of these characters and contains one of
+# these phrases (see geo_extractors.findall_in_runs)
+DEFINITION_RUN_PATTERN = re.compile(r'[\w\s,]+')
+DEFINITION_KEYWORD_PATTERN = re.compile(
+    r'\s(?:is|are|was|were)\s|\srefers?\s|\smeans?\s|defined\s|definition\s',
+    re.IGNORECASE
+)
+
 # =============================================================================
 # COMPARISON PATTERNS
 # =============================================================================
@@ -56,6 +64,15 @@ COMPARISON_PATTERN = re.compile(
     re.IGNORECASE
 )
 
+# A comparison lies within one run of these characters and contains one of
+# these words
+COMPARISON_RUN_PATTERN = re.compile(r'[\w\s.?]+')
+COMPARISON_KEYWORD_PATTERN = re.compile(
+    r'\svs|\sversus\s|compared\s|difference\s|better\s|worse\s'
+    r'|pros\s|advantages\s|\sor\s',
+    re.IGNORECASE
+)
+
 # =============================================================================
 # STATISTICS PATTERNS
 # =============================================================================
@@ -119,8 +136,9 @@ EXPERT_PATTERN = re.compile(
 # TEMPORAL PATTERNS
 # =============================================================================
 
-# Match years (19xx, 20xx)
-YEAR_PATTERN = re.compile(r'\b(19\d{2}|20\d{2})\b')
+# Match years (19xx, 20xx). ASCII digits and word boundaries: faster, and a
+# year next to a CJK character (e.g. 2024年) still counts
+YEAR_PATTERN = re.compile(r'\b(19\d{2}|20\d{2})\b', re.ASCII)
 
 # Relative time phrases
 RELATIVE_TIME_PATTERN = re.compile(
@@ -169,6 +187,15 @@ SEMANTIC_TRIPLE_PATTERN = re.compile(
     re.IGNORECASE
 )
 
+# A triple lies within one run of word/space characters and contains a
+# whitespace-delimited predicate
+SEMANTIC_TRIPLE_RUN_PATTERN = re.compile(r'[\w\s]+')
+SEMANTIC_TRIPLE_KEYWORD_PATTERN = re.compile(
+    r'\s(?:is|are|has|have|provides?|offers?|includes?|contains?|'
+    r'enables?|allows?|supports?|requires?|uses?|creates?|generates?)\s',
+    re.IGNORECASE
+)
+
 # =============================================================================
 # AUTHORITY DOMAINS
 # =============================================================================
@@ -238,6 +265,11 @@ AUTHORITY_DOMAINS = {
     'healthline.com',
 }
 
+# AUTHORITY_DOMAINS split for suffix lookups: dotted entries match any host
+# ending with them, the rest match the host itself or any subdomain of it
+AUTHORITY_SUFFIXES = frozenset(d for d in AUTHORITY_DOMAINS if d.startswith('.'))
+AUTHORITY_HOSTS = frozenset(d for d in AUTHORITY_DOMAINS if not d.startswith('.'))
+
 # =============================================================================
 # TRUST PAGE PATTERNS
 # =============================================================================
@@ -263,8 +295,10 @@ TRUST_PAGE_PATTERN = re.compile(
 # EMAIL AND PHONE PATTERNS
 # =============================================================================
 
+# ASCII word boundaries, matching the ASCII-only address classes
 EMAIL_PATTERN = re.compile(
-    r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+    r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
+    re.ASCII
 )
 
 PHONE_PATTERN = re.compile(
@@ -273,3 +307,27 @@ PHONE_PATTERN = re.compile(
     r'|\+\d{1,3}[-.\s]?\d{2,4}[-.\s]?\d{3,4}[-.\s]?\d{3,4}'  # International
     r')'
 )
+
+# =============================================================================
+# MULTIMEDIA / FRAMEWORK KEYWORD PATTERNS
+# =============================================================================
+
+# Image alt/src keywords that suggest an infographic
+INFOGRAPHIC_PATTERN = re.compile(
+    r'infographic|chart|diagram|graph|visualization',
+    re.IGNORECASE
+)
+
+# JS framework needles in <script src>, mapped to signal names
+JS_FRAMEWORK_SRC_PATTERN = re.compile(
+    r'react|angular|vue|jquery|next|nuxt',
+    re.IGNORECASE
+)
+JS_FRAMEWORK_SRC_NAMES = {
+    'react': 'react',
+    'angular': 'angular',
+    'vue': 'vue',
+    'jquery': 'jquery',
+    'next': 'nextjs',
+    'nuxt': 'nuxt',
+}
@@ -1,15 +1,51 @@
 # Define your item pipelines here
 
+import asyncio
+import gzip
 import json
 import hashlib
+import http.client
+import multiprocessing
 import os
 import re
+import select
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from urllib.parse import urlparse, urljoin
 from email.utils import parsedate_to_datetime
-
-from bs4 import BeautifulSoup
+from functools import lru_cache, partial
+
+from bs4 import BeautifulSoup, Tag
+from bs4.builder import LXMLTreeBuilder
+from cssselect import HTMLTranslator
+from lxml import etree
+from scrapy.utils.defer import deferred_from_coro
+from twisted.internet import task
+
+# orjson parses large JSON-LD blocks and serializes output items several
+# times faster; optional. json_dumps always returns UTF-8 bytes.
+try:
+    import orjson
+    json_loads = orjson.loads
+
+    def json_dumps(obj, indent=False):
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=str, option=option)
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+
+    def json_dumps(obj, indent=False):
+        if indent:
+            return json.dumps(obj, ensure_ascii=False, indent=2, default=str).encode('utf-8')
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+# msgpack is an optional, more compact wire format for ApiPipeline batches
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 from dateutil import parser as date_parser
 from dateutil.parser import ParserError
 
@@ -27,8 +63,245 @@ from .geo_extractors import (
     MultimediaExtractor,
     AICrawlabilityExtractor,
     # BrokenLinkExtractor - excluded for performance (makes external HTTP requests)
+    CrawlabilityCounters,
+    element_text,
+    parse_html_tree,
+    utf8_len,
+)
+
+
+class PrunedLXMLTreeBuilder(LXMLTreeBuilder):
+    """
+    LXMLTreeBuilder that drops the subtrees of skip_tags while parsing.
+
+    SoupStrainer can only filter top-level tags (everything under <html> is
+    kept), so pruning happens on the parser events instead: skipped elements
+    and their descendants never become Tag objects.
+    """
+
+    def __init__(self, skip_tags, **kwargs):
+        super().__init__(**kwargs)
+        self.skip_tags = skip_tags
+        self._skip_depth = 0
+
+    def feed(self, markup):
+        self._skip_depth = 0
+        super().feed(markup)
+
+    def start(self, tag, attrib, nsmap={}):
+        if self._skip_depth or tag in self.skip_tags:
+            self._skip_depth += 1
+            return
+        super().start(tag, attrib, nsmap)
+
+    def end(self, tag):
+        if self._skip_depth:
+            self._skip_depth -= 1
+            return
+        super().end(tag)
+
+    def data(self, data):
+        if not self._skip_depth:
+            super().data(data)
+
+    def comment(self, text):
+        if not self._skip_depth:
+            super().comment(text)
+
+
+# Shared lxml-backed tree builder: C parser instead of the pure-Python
+# html.parser, and no per-call builder lookup/construction. Inline SVG and
+# <style> are never inspected through the soup, so they are not built.
+HTML_BUILDER = PrunedLXMLTreeBuilder(frozenset({'svg', 'style'}))
+
+# Subtrees left out of main content text
+MAIN_CONTENT_SKIP_TAGS = frozenset({'script', 'style', 'noscript', 'iframe', 'nav', 'aside'})
+BODY_BOILERPLATE_TAGS = frozenset({
+    'script', 'style', 'noscript', 'iframe',
+    'nav', 'header', 'footer', 'aside',
+    'form', 'button', 'input', 'select', 'textarea',
+})
+
+# Extractor guards: readability scores are noise on stub pages, and the
+# regex-heavy text extractors only see a prefix of very large pages
+MIN_READABILITY_WORDS = 50
+LARGE_PAGE_BYTES = 2 * 1024 * 1024
+MAX_ANALYZED_TEXT_CHARS = 500_000
+# Seconds to wait for one GEO extractor when EXTRACTOR_THREADS is enabled
+EXTRACTOR_TIMEOUT = 30
+
+# Images, links, meta and date elements, selected in C on the lxml tree. Elements inside
+# subtrees the soup drops (body noscript/iframe are removed by
+# _prepare_body, svg is pruned) are not counted.
+_OUTSIDE_DROPPED = (
+    'not(ancestor::svg or ancestor::noscript[ancestor::body]'
+    ' or ancestor::iframe[ancestor::body])'
+)
+IMAGES_XPATH = etree.XPath(f'(//img[{_OUTSIDE_DROPPED}])[position() <= 100]')
+LINKS_XPATH = etree.XPath(f'(//a[@href][{_OUTSIDE_DROPPED}])[position() <= 500]')
+META_XPATH = etree.XPath(f'//meta[@name or @property][{_OUTSIDE_DROPPED}]')
+TIME_XPATH = etree.XPath(f'(//time[{_OUTSIDE_DROPPED}])[position() <= 10]')
+
+# Common class names/attributes that often contain dates: (CSS selector, date
+# type). The first 3 matches of each selector are checked.
+HTML_DATE_SELECTORS = [
+    # Published
+    ('.published', 'published'),
+    ('.post-date', 'published'),
+    ('.entry-date', 'published'),
+    ('.article-date', 'published'),
+    ('.date-published', 'published'),
+    ('.publish-date', 'published'),
+    ('[itemprop="datePublished"]', 'published'),
+    ('[data-date]', 'published'),
+    # Modified
+    ('.modified', 'modified'),
+    ('.updated', 'modified'),
+    ('.last-modified', 'modified'),
+    ('.date-modified', 'modified'),
+    ('[itemprop="dateModified"]', 'modified'),
+]
+# Selectors are translated to XPath once: a per-element matcher for each, and
+# one grouped query that finds every candidate in a single tree walk
+_HTML_DATE_SELF_XPATHS = [
+    HTMLTranslator().css_to_xpath(selector, prefix='self::') for selector, _ in HTML_DATE_SELECTORS
+]
+HTML_DATE_MATCHERS = [
+    (selector, date_type, etree.XPath(f'boolean({self_xpath})'))
+    for (selector, date_type), self_xpath in zip(HTML_DATE_SELECTORS, _HTML_DATE_SELF_XPATHS)
+]
+HTML_DATE_CANDIDATES_XPATH = etree.XPath(
+    f'//*[{" or ".join(_HTML_DATE_SELF_XPATHS)}][{_OUTSIDE_DROPPED}]'
 )
 
+# Precompiled patterns (hot per-page / per-link paths)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+MODIFIED_DATE_PATTERN = re.compile(r'modified|updated|edit', re.I)
+CONTENT_TYPE_PATTERN = re.compile(r'content-type', re.I)
+CHARSET_PATTERN = re.compile(r'charset=([^\s;]+)', re.I)
+CONTENT_CONTAINER_PATTERN = re.compile(r'(article|post|entry|content|main)[-_]?(body|content|text|area)?', re.I)
+# Non-navigational hrefs; only hrefs starting with one of SKIP_HREF_FIRST_CHARS
+# can match, so most links are cleared by a one-character set lookup
+SKIP_HREF_PATTERN = re.compile(r'(?:javascript:|mailto:|tel:|data:)', re.I)
+SKIP_HREF_FIRST_CHARS = frozenset('jmtdJMTD')
+BOILERPLATE_PATTERN = re.compile(
+    r'(nav|menu|sidebar|footer|header|comment|share|social|related|widget|ad|promo|banner|cookie|popup|modal)',
+    re.I
+)
+# Generic anchor patterns, merged into one alternation so a single search checks them all
+GENERIC_ANCHOR_PATTERN = re.compile('|'.join((
+    r'^click\s',          # starts with "click"
+    r'^clic\s',           # French/Spanish click
+    r'\shere$',           # ends with "here"
+    r'\sici$',            # ends with "ici" (French)
+    r'\saquí$',           # ends with "aquí" (Spanish)
+    r'^read\s',           # starts with "read"
+    r'^lire\s',           # starts with "lire"
+    r'^leer\s',           # starts with "leer"
+    r'^voir\s',           # starts with "voir"
+    r'^ver\s',            # starts with "ver"
+    r'more\s*>>?$',       # ends with "more >" or "more >>"
+    r'plus\s*>>?$',       # ends with "plus >"
+    r'más\s*>>?$',        # ends with "más >"
+    r'^\d+$',             # just numbers
+    r'^#\d+$',            # just #number
+)))
+
+
+@lru_cache(maxsize=256)
+def _parse_date_string(date_str):
+    """
+    Parse a stripped, non-empty date string into ISO format (or None).
+
+    Cached: the same date often appears in JSON-LD, OG and meta tags.
+    """
+    # Fast path: most JSON-LD/OG dates are already ISO-8601 (YYYY-MM-DD...)
+    if len(date_str) >= 10 and date_str[4] == '-' and date_str[7] == '-':
+        try:
+            parsed = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed.isoformat()
+        except ValueError:
+            pass
+
+    try:
+        # Try dateutil parser (handles most formats)
+        parsed = date_parser.parse(date_str, fuzzy=True)
+        # Ensure timezone aware
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.isoformat()
+    except (ParserError, ValueError, OverflowError):
+        pass
+
+    # Try HTTP date format (RFC 2822)
+    try:
+        parsed = parsedate_to_datetime(date_str)
+        return parsed.isoformat()
+    except (ValueError, TypeError):
+        pass
+
+    return None
+
+
+def _extract_readability(text, word_count):
+    """Readability metrics, skipped on stub pages where the scores are noise."""
+    if word_count < MIN_READABILITY_WORDS:
+        return {"skipped": "too_short"}
+    return ReadabilityExtractor.extract(text)
+
+
+# GEO extractors run per page: (item key, callable, names of its arguments in
+# the context built by _extract_enhanced_metadata). A failing extractor sets
+# its key to {"error": ...}.
+GEO_EXTRACTORS = [
+    # 1. Readability metrics (requires textstat)
+    ("readability", _extract_readability, ("text", "word_count")),
+    # 2. Content patterns (questions, definitions, comparisons, statistics, etc.)
+    ("content_patterns", ContentPatternsExtractor.extract, ("text", "soup")),
+    # 3. Enhanced heading analysis
+    ("heading_analysis", HeadingAnalysisExtractor.extract, ("soup",)),
+    # 4. Structure elements (lists, tables, blockquotes, code blocks, figures)
+    ("structure_elements", StructureElementsExtractor.extract, ("soup",)),
+    # 5. Enhanced schema/JSON-LD analysis
+    ("schema_analysis", SchemaExtractor.extract, ("soup",)),
+    # 6. E-E-A-T signals (Experience, Expertise, Authoritativeness, Trust)
+    ("eeat_signals", EEATExtractor.extract, ("soup", "url")),
+    # 7. Outbound/authority link analysis
+    ("outbound_link_analysis", LinkAnalysisExtractor.extract, ("soup", "url")),
+    # 8. Hreflang tags for international SEO
+    ("hreflang", HreflangExtractor.extract, ("soup",)),
+    # 9. Temporal signals (years mentioned, freshness indicators)
+    ("temporal_signals", TemporalExtractor.extract, ("text", "published", "modified", "http_last_modified")),
+    # 10. Multimedia elements (videos, audio, PDFs, infographics)
+    ("multimedia", MultimediaExtractor.extract, ("tree",)),
+    # 11. AI crawlability signals
+    ("ai_crawlability", AICrawlabilityExtractor.extract, ("tree", "raw_html")),
+]
+
+
+def extract_item_metadata(item, pipeline=None):
+    """
+    Parse item["raw_html"] and add all enhanced metadata fields to the item.
+
+    Module-level so it can also run in a worker process (EXTRACTION_WORKERS).
+    Pass the running pipeline to reuse its extractor thread pool.
+    """
+    raw_html = item.get("raw_html", "")
+    soup = BeautifulSoup(raw_html, builder=HTML_BUILDER)
+    # lxml tree of the untouched document for attribute-heavy extractors
+    tree = parse_html_tree(raw_html)
+    pipeline = pipeline or DumbCrawlerPipeline()
+    return pipeline._extract_enhanced_metadata(item, soup, item.get("url", ""), tree)
+
+
+def _extract_item_metadata_worker(item):
+    """Worker-process entry point; raw_html is not pickled back to the reactor."""
+    item = extract_item_metadata(item)
+    item.pop("raw_html", None)
+    return item
+
 
 class DumbCrawlerPipeline:
     """
@@ -43,9 +316,56 @@ class DumbCrawlerPipeline:
     - Internal/external links
     - JSON-LD structured data
     - Content metrics (word count, page size)
+
+    Extraction is CPU-bound pure Python. With EXTRACTION_WORKERS > 0 it runs
+    in a process pool so the Twisted reactor thread only handles IO.
+    Alternatively, EXTRACTOR_THREADS > 0 runs the GEO extractors of each page
+    concurrently in a thread pool.
     """
 
-    def process_item(self, item, spider):
+    def __init__(self, extraction_workers=0, extractor_threads=0, drop_raw_html=False):
+        self.extraction_workers = extraction_workers
+        self.extractor_threads = extractor_threads
+        self.drop_raw_html = drop_raw_html
+        self._executor = None
+        self._thread_executor = None
+        self.crawlability_counters = CrawlabilityCounters()
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(
+            crawler.settings.getint('EXTRACTION_WORKERS', 0),
+            crawler.settings.getint('EXTRACTOR_THREADS', 0),
+            crawler.settings.getbool('DROP_RAW_HTML', False),
+        )
+
+    def open_spider(self, spider):
+        """Start the extraction worker pool if enabled."""
+        if self.extraction_workers > 0:
+            # spawn: forking a process that runs the reactor/Playwright threads is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.extraction_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+            spider.logger.info(f"Metadata extraction using {self.extraction_workers} worker processes")
+        elif self.extractor_threads > 0:
+            self._thread_executor = ThreadPoolExecutor(max_workers=self.extractor_threads)
+
+    def close_spider(self, spider):
+        """Stop the extraction worker pool and log crawl-level AI crawlability stats."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._thread_executor is not None:
+            self._thread_executor.shutdown(wait=True)
+            self._thread_executor = None
+        if len(self.crawlability_counters):
+            spider.logger.info(
+                f"AI crawlability over {len(self.crawlability_counters)} pages: "
+                f"{self.crawlability_counters.summary()}"
+            )
+
+    async def process_item(self, item, spider):
         """Process each crawled item with full metadata extraction."""
         # Add crawl timestamp
         item["crawled_at"] = datetime.now(timezone.utc).isoformat()
@@ -65,66 +385,79 @@ class DumbCrawlerPipeline:
 
         if raw_html:
             try:
-                soup = BeautifulSoup(raw_html, 'html.parser')
-                item = self._extract_enhanced_metadata(item, soup, url)
+                if self._executor is not None:
+                    future = self._executor.submit(_extract_item_metadata_worker, dict(item))
+                    item.update(await asyncio.wrap_future(future))
+                else:
+                    item = extract_item_metadata(item, self)
+                self.crawlability_counters.append(item.get("ai_crawlability") or {})
             except Exception as e:
                 spider.logger.debug(f"Error parsing HTML for {url}: {e}")
 
+            if self.drop_raw_html:
+                # Everything downstream needs has been extracted; keep only a
+                # fingerprint (size is in page_size_bytes)
+                item["raw_html_sha256"] = hashlib.sha256(raw_html.encode('utf-8')).hexdigest()
+                del item["raw_html"]
+
         return item
 
-    def _extract_enhanced_metadata(self, item, soup, url):
+    def _extract_enhanced_metadata(self, item, soup, url, tree):
         """Extract all enhanced metadata from parsed HTML."""
         parsed_url = urlparse(url)
         base_domain = self._get_base_domain(parsed_url.netloc)
 
         # === CONTENT METRICS ===
-        item["page_size_bytes"] = len(item.get("raw_html", "").encode('utf-8'))
-        body_text = self._extract_body_text(soup)
+        item["page_size_bytes"] = utf8_len(item.get("raw_html", ""))
+        body = self._prepare_body(soup)
+        body_text = self._extract_body_text(body)
         item["body_text"] = body_text
-        item["word_count"] = len(body_text.split()) if body_text else 0
+        # Text is whitespace-normalized (single spaces, stripped), so words = spaces + 1
+        item["word_count"] = body_text.count(' ') + 1 if body_text else 0
 
         # === MAIN CONTENT (for entity extraction - excludes nav/header/footer/sidebar) ===
-        main_content = self._extract_main_content(soup)
+        main_content = self._extract_main_content(soup, body)
         item["main_content"] = main_content
-        item["main_content_word_count"] = len(main_content.split()) if main_content else 0
+        item["main_content_word_count"] = main_content.count(' ') + 1 if main_content else 0
 
         # === HEADING HIERARCHY ===
         item["h2_tags"] = [h.get_text(strip=True) for h in soup.find_all('h2') if h.get_text(strip=True)]
         item["h3_tags"] = [h.get_text(strip=True) for h in soup.find_all('h3') if h.get_text(strip=True)]
 
         # === SEO META TAGS ===
+        meta_names, meta_properties = self._index_meta_tags(tree)
         item["canonical_url"] = self._get_tag_content(soup, 'link', rel='canonical', attr='href')
-        item["meta_robots"] = self._get_meta_content(soup, 'robots')
+        item["meta_robots"] = meta_names.get('robots')
         item["lang"] = soup.find('html').get('lang') if soup.find('html') else None
-        item["viewport"] = self._get_meta_content(soup, 'viewport')
+        item["viewport"] = meta_names.get('viewport')
         item["charset"] = self._get_charset(soup)
 
         # === OPEN GRAPH ===
         item["og"] = {
-            "title": self._get_meta_property(soup, 'og:title'),
-            "description": self._get_meta_property(soup, 'og:description'),
-            "image": self._get_meta_property(soup, 'og:image'),
-            "url": self._get_meta_property(soup, 'og:url'),
-            "type": self._get_meta_property(soup, 'og:type'),
-            "site_name": self._get_meta_property(soup, 'og:site_name'),
+            "title": meta_properties.get('og:title'),
+            "description": meta_properties.get('og:description'),
+            "image": meta_properties.get('og:image'),
+            "url": meta_properties.get('og:url'),
+            "type": meta_properties.get('og:type'),
+            "site_name": meta_properties.get('og:site_name'),
         }
 
         # === TWITTER CARDS ===
         item["twitter"] = {
-            "card": self._get_meta_content(soup, 'twitter:card'),
-            "title": self._get_meta_content(soup, 'twitter:title'),
-            "description": self._get_meta_content(soup, 'twitter:description'),
-            "image": self._get_meta_content(soup, 'twitter:image'),
-            "site": self._get_meta_content(soup, 'twitter:site'),
+            "card": meta_names.get('twitter:card'),
+            "title": meta_names.get('twitter:title'),
+            "description": meta_names.get('twitter:description'),
+            "image": meta_names.get('twitter:image'),
+            "site": meta_names.get('twitter:site'),
         }
 
         # === IMAGES ===
-        images = self._extract_images(soup, url)
+        images = self._extract_images(tree, url)
         item["images"] = images
         item["images_count"] = len(images)
 
         # === LINKS ANALYSIS ===
-        internal_links, external_links = self._extract_links(soup, url, base_domain)
+        internal_links, external_links = self._extract_links(tree, url, base_domain)
         item["internal_links"] = internal_links
         item["internal_links_count"] = len(internal_links)
         item["external_links"] = external_links
@@ -137,82 +470,59 @@ class DumbCrawlerPipeline:
         # === JSON-LD STRUCTURED DATA ===
         json_ld = self._extract_json_ld(soup)
         item["json_ld"] = json_ld
-        item["schema_types"] = self._extract_schema_types(json_ld)
+        # One walk collects both the @type values and the date fields
+        schema_types, seen_types, json_ld_dates = [], set(), []
+        for entry in self._walk_json_ld(json_ld):
+            if entry[0] == 'type':
+                if entry[1] not in seen_types:
+                    seen_types.add(entry[1])
+                    schema_types.append(entry[1])
+            else:
+                json_ld_dates.append(entry[1:])
+        item["schema_types"] = schema_types
 
         # === CONTENT AGE ===
-        item["content_age"] = self._extract_content_age(item, soup, json_ld)
+        item["content_age"] = self._extract_content_age(item, tree, json_ld_dates, meta_names, meta_properties)
 
         # === GEO EXTRACTORS (Generative Engine Optimization) ===
-        try:
-            # 1. Readability metrics (requires textstat)
-            item["readability"] = ReadabilityExtractor.extract(body_text)
-        except Exception as e:
-            item["readability"] = {"error": str(e)}
-
-        try:
-            # 2. Content patterns (questions, definitions, comparisons, statistics, etc.)
-            item["content_patterns"] = ContentPatternsExtractor.extract(body_text, soup)
-        except Exception as e:
-            item["content_patterns"] = {"error": str(e)}
-
-        try:
-            # 3. Enhanced heading analysis
-            item["heading_analysis"] = HeadingAnalysisExtractor.extract(soup)
-        except Exception as e:
-            item["heading_analysis"] = {"error": str(e)}
-
-        try:
-            # 4. Structure elements (lists, tables, blockquotes, code blocks, figures)
-            item["structure_elements"] = StructureElementsExtractor.extract(soup)
-        except Exception as e:
-            item["structure_elements"] = {"error": str(e)}
-
-        try:
-            # 5. Enhanced schema/JSON-LD analysis
-            item["schema_analysis"] = SchemaExtractor.extract(soup)
-        except Exception as e:
-            item["schema_analysis"] = {"error": str(e)}
-
-        try:
-            # 6. E-E-A-T signals (Experience, Expertise, Authoritativeness, Trust)
-            item["eeat_signals"] = EEATExtractor.extract(soup, url)
-        except Exception as e:
-            item["eeat_signals"] = {"error": str(e)}
-
-        try:
-            # 7. Outbound/authority link analysis
-            item["outbound_link_analysis"] = LinkAnalysisExtractor.extract(soup, url)
-        except Exception as e:
-            item["outbound_link_analysis"] = {"error": str(e)}
-
-        try:
-            # 8. Hreflang tags for international SEO
-            item["hreflang"] = HreflangExtractor.extract(soup)
-        except Exception as e:
-            item["hreflang"] = {"error": str(e)}
-
-        try:
-            # 9. Temporal signals (years mentioned, freshness indicators)
-            published_date = item.get("content_age", {}).get("published")
-            modified_date = item.get("content_age", {}).get("modified")
-            http_last_modified = item.get("response_headers", {}).get("Last-Modified")
-            item["temporal_signals"] = TemporalExtractor.extract(
-                body_text, published_date, modified_date, http_last_modified
-            )
-        except Exception as e:
-            item["temporal_signals"] = {"error": str(e)}
-
-        try:
-            # 10. Multimedia elements (videos, audio, PDFs, infographics)
-            item["multimedia"] = MultimediaExtractor.extract(soup)
-        except Exception as e:
-            item["multimedia"] = {"error": str(e)}
+        analyzed_text = body_text
+        if item["page_size_bytes"] > LARGE_PAGE_BYTES:
+            analyzed_text = body_text[:MAX_ANALYZED_TEXT_CHARS]
+
+        content_age = item.get("content_age", {})
+        context = {
+            "text": analyzed_text,
+            "word_count": item["word_count"],
+            "soup": soup,
+            "tree": tree,
+            "url": url,
+            "raw_html": item.get("raw_html", ""),
+            "published": content_age.get("published"),
+            "modified": content_age.get("modified"),
+            "http_last_modified": item.get("response_headers", {}).get("Last-Modified"),
+        }
+        extractors = [
+            (key, extract, [context[name] for name in arg_names])
+            for key, extract, arg_names in GEO_EXTRACTORS
+        ]
 
-        try:
-            # 11. AI crawlability signals
-            item["ai_crawlability"] = AICrawlabilityExtractor.extract(soup, item.get("raw_html", ""))
-        except Exception as e:
-            item["ai_crawlability"] = {"error": str(e)}
+        if self._thread_executor is not None:
+            # Extractors only read soup/tree, so they can share them across threads
+            futures = [
+                (key, self._thread_executor.submit(extract, *args))
+                for key, extract, args in extractors
+            ]
+            for key, future in futures:
+                try:
+                    item[key] = future.result(timeout=EXTRACTOR_TIMEOUT)
+                except Exception as e:
+                    item[key] = {"error": str(e)}
+        else:
+            for key, extract, args in extractors:
+                try:
+                    item[key] = extract(*args)
+                except Exception as e:
+                    item[key] = {"error": str(e)}
 
         return item
 
@@ -223,15 +533,22 @@ class DumbCrawlerPipeline:
         parts = netloc.lower().split('.')
         return '.'.join(parts[-2:]) if len(parts) >= 2 else netloc.lower()
 
-    def _get_meta_content(self, soup, name):
-        """Extract <meta name="X"> content."""
-        meta = soup.find('meta', attrs={'name': re.compile(f'^{re.escape(name)}$', re.I)})
-        return meta.get('content') if meta and meta.get('content') else None
+    def _index_meta_tags(self, tree):
+        """
+        Index <meta name="X"> and <meta property="X"> content in one XPath pass.
 
-    def _get_meta_property(self, soup, prop):
-        """Extract <meta property="X"> content (Open Graph)."""
-        meta = soup.find('meta', attrs={'property': re.compile(f'^{re.escape(prop)}$', re.I)})
-        return meta.get('content') if meta and meta.get('content') else None
+        Returns (by_name, by_property) dicts keyed by lowercased name/property.
+        The first tag wins; empty content is stored as None.
+        """
+        by_name, by_property = {}, {}
+        for meta in META_XPATH(tree):
+            name = meta.get('name')
+            if name is not None:
+                by_name.setdefault(name.lower(), meta.get('content') or None)
+            prop = meta.get('property')
+            if prop is not None:
+                by_property.setdefault(prop.lower(), meta.get('content') or None)
+        return by_name, by_property
 
     def _get_tag_content(self, soup, tag, attr='content', **find_attrs):
         """Extract content from a specific tag with attributes."""
@@ -243,25 +560,35 @@ class DumbCrawlerPipeline:
         meta = soup.find('meta', charset=True)
         if meta:
             return meta['charset']
-        meta = soup.find('meta', attrs={'http-equiv': re.compile(r'content-type', re.I)})
+        meta = soup.find('meta', attrs={'http-equiv': CONTENT_TYPE_PATTERN})
         if meta and meta.get('content'):
-            match = re.search(r'charset=([^\s;]+)', meta['content'], re.I)
+            match = CHARSET_PATTERN.search(meta['content'])
             if match:
                 return match.group(1)
         return None
 
-    def _extract_body_text(self, soup):
-        """Extract visible text from body, excluding scripts/styles."""
+    def _prepare_body(self, soup):
+        """
+        Find <body> and remove script/style/noscript/iframe from it in place.
+
+        The cleaned body is shared by body text, main content and the
+        soup-based GEO extractors, so it is cleaned once instead of per use.
+        Returns None if the page has no body.
+        """
         body = soup.find('body')
+        if body:
+            for element in body.find_all(['script', 'style', 'noscript', 'iframe']):
+                element.decompose()
+        return body
+
+    def _extract_body_text(self, body):
+        """Extract visible text from the cleaned body (see _prepare_body)."""
         if not body:
             return ''
-        # Remove unwanted elements
-        for element in body.find_all(['script', 'style', 'noscript', 'iframe']):
-            element.decompose()
         text = body.get_text(separator=' ', strip=True)
-        return re.sub(r'\s+', ' ', text).strip()
+        return WHITESPACE_PATTERN.sub(' ', text).strip()
 
-    def _extract_main_content(self, soup):
+    def _extract_main_content(self, soup, body):
         """
         Extract main article content, excluding navigation/header/footer/sidebar.
 
@@ -272,20 +599,16 @@ class DumbCrawlerPipeline:
         main_element = soup.find('main') or soup.find('article')
 
         if main_element:
-            # Clone to avoid modifying original
-            main_clone = BeautifulSoup(str(main_element), 'html.parser')
-            # Remove nested nav/aside within main
-            for element in main_clone.find_all(['script', 'style', 'noscript', 'iframe', 'nav', 'aside']):
-                element.decompose()
-            text = main_clone.get_text(separator=' ', strip=True)
-            text = re.sub(r'\s+', ' ', text).strip()
+            # Skip nested nav/aside within main (without cloning the subtree)
+            text = self._collect_text(main_element, MAIN_CONTENT_SKIP_TAGS)
+            text = WHITESPACE_PATTERN.sub(' ', text).strip()
             if len(text) > 200:  # Valid main content
                 return text
 
         # Strategy 2: Look for common content containers
         content_selectors = [
-            {'class_': re.compile(r'(article|post|entry|content|main)[-_]?(body|content|text|area)?', re.I)},
-            {'id': re.compile(r'(article|post|entry|content|main)[-_]?(body|content|text|area)?', re.I)},
+            {'class_': CONTENT_CONTAINER_PATTERN},
+            {'id': CONTENT_CONTAINER_PATTERN},
             {'role': 'main'},
             {'itemprop': 'articleBody'},
         ]
@@ -293,76 +616,87 @@ class DumbCrawlerPipeline:
         for selector in content_selectors:
             element = soup.find(['div', 'section', 'article'], attrs=selector)
             if element:
-                elem_clone = BeautifulSoup(str(element), 'html.parser')
-                for unwanted in elem_clone.find_all(['script', 'style', 'noscript', 'iframe', 'nav', 'aside']):
-                    unwanted.decompose()
-                text = elem_clone.get_text(separator=' ', strip=True)
-                text = re.sub(r'\s+', ' ', text).strip()
+                text = self._collect_text(element, MAIN_CONTENT_SKIP_TAGS)
+                text = WHITESPACE_PATTERN.sub(' ', text).strip()
                 if len(text) > 200:
                     return text
 
         # Strategy 3: Fallback - body minus nav/header/footer/aside
-        body = soup.find('body')
         if not body:
             return ''
 
-        body_clone = BeautifulSoup(str(body), 'html.parser')
-        # Remove all structural/boilerplate elements
-        for element in body_clone.find_all([
-            'script', 'style', 'noscript', 'iframe',
-            'nav', 'header', 'footer', 'aside',
-            'form', 'button', 'input', 'select', 'textarea'
-        ]):
-            element.decompose()
-
-        # Also remove elements with common boilerplate class names
-        boilerplate_patterns = re.compile(
-            r'(nav|menu|sidebar|footer|header|comment|share|social|related|widget|ad|promo|banner|cookie|popup|modal)',
-            re.I
-        )
-        for element in body_clone.find_all(class_=boilerplate_patterns):
-            element.decompose()
-        for element in body_clone.find_all(id=boilerplate_patterns):
-            element.decompose()
-
-        text = body_clone.get_text(separator=' ', strip=True)
-        return re.sub(r'\s+', ' ', text).strip()
+        # Skip all structural/boilerplate elements, and elements with common
+        # boilerplate class names or ids
+        text = self._collect_text(body, BODY_BOILERPLATE_TAGS, BOILERPLATE_PATTERN)
+        return WHITESPACE_PATTERN.sub(' ', text).strip()
 
-    def _extract_images(self, soup, base_url):
+    def _collect_text(self, element, skip_tags, boilerplate=None):
+        """
+        Equivalent of element.get_text(separator=' ', strip=True) with the
+        subtrees of skip_tags (and of tags whose class/id match boilerplate)
+        left out. Walks the tree in place instead of cloning and decomposing.
+        """
+        parts = []
+        stack = [element]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Tag):
+                if node.name in skip_tags:
+                    continue
+                if boilerplate is not None:
+                    classes = node.get('class')
+                    if classes and boilerplate.search(' '.join(classes)):
+                        continue
+                    node_id = node.get('id')
+                    if node_id and boilerplate.search(node_id):
+                        continue
+                stack.extend(reversed(node.contents))
+            elif type(node) in Tag.MAIN_CONTENT_STRING_TYPES:
+                stripped = node.strip()
+                if stripped:
+                    parts.append(stripped)
+        return ' '.join(parts)
+
+    def _extract_images(self, tree, base_url):
         """Extract image data: src, alt, dimensions."""
         images = []
-        for img in soup.find_all('img')[:100]:  # Limit to first 100
+        for img in IMAGES_XPATH(tree):  # Limit to first 100
             src = img.get('src', '')
             if src:
                 src = urljoin(base_url, src)
             image_data = {'src': src, 'alt': img.get('alt', '')}
-            if img.get('width'):
-                image_data['width'] = img['width']
-            if img.get('height'):
-                image_data['height'] = img['height']
+            width = img.get('width')
+            if width:
+                image_data['width'] = width
+            height = img.get('height')
+            if height:
+                image_data['height'] = height
             images.append(image_data)
         return images
 
-    def _extract_links(self, soup, page_url, base_domain):
+    def _extract_links(self, tree, page_url, base_domain):
         """Extract and categorize links as internal or external."""
         internal, external = [], []
-        for a in soup.find_all('a', href=True)[:500]:  # Limit to first 500
-            href = a['href']
-            if href.startswith(('javascript:', 'mailto:', 'tel:', '#', 'data:')):
+        domain_cache = {}  # netloc -> base domain; links repeat a few hosts
+        for a in LINKS_XPATH(tree):  # Limit to first 500
+            href = a.get('href')
+            first_char = href[:1]
+            if first_char == '#' or (first_char in SKIP_HREF_FIRST_CHARS and SKIP_HREF_PATTERN.match(href)):
                 continue
             full_url = urljoin(page_url, href)
             parsed = urlparse(full_url)
             if parsed.scheme not in ('http', 'https'):
                 continue
-            rel = a.get('rel', [])
-            if isinstance(rel, str):
-                rel = rel.split()
+            rel = a.get('rel')
+            rel = rel.split() if rel else []
             link_data = {
                 'url': full_url,
-                'anchor': a.get_text(strip=True)[:100],
+                'anchor': element_text(a, strip=True)[:100],
                 'nofollow': 'nofollow' in rel,
             }
-            link_domain = self._get_base_domain(parsed.netloc)
+            link_domain = domain_cache.get(parsed.netloc)
+            if link_domain is None:
+                link_domain = domain_cache[parsed.netloc] = self._get_base_domain(parsed.netloc)
             if link_domain == base_domain:
                 internal.append(link_data)
             else:
@@ -370,7 +704,7 @@ class DumbCrawlerPipeline:
         return internal, external
 
     # Generic anchor text patterns (EN/FR/ES) - bad for SEO
-    GENERIC_ANCHORS = {
+    GENERIC_ANCHORS = frozenset({
         # English
         'click here', 'click', 'here', 'read more', 'read', 'more', 'learn more',
         'learn', 'see more', 'view more', 'view', 'see', 'go', 'go here', 'link',
@@ -397,7 +731,7 @@ class DumbCrawlerPipeline:
         'visita', 'este enlace', 'esta página', 'este artículo', 'este sitio',
         # Common symbols/patterns
         '>', '>>', '→', '...', '»', 'more...', 'lire...', 'más...',
-    }
+    })
 
     def _analyze_anchor_texts(self, internal_links):
         """
@@ -448,30 +782,7 @@ class DumbCrawlerPipeline:
         if len(anchor_lower) <= 2:
             return True
 
-        # Check for patterns
-        generic_patterns = [
-            r'^click\s',          # starts with "click"
-            r'^clic\s',           # French/Spanish click
-            r'\shere$',           # ends with "here"
-            r'\sici$',            # ends with "ici" (French)
-            r'\saquí$',           # ends with "aquí" (Spanish)
-            r'^read\s',           # starts with "read"
-            r'^lire\s',           # starts with "lire"
-            r'^leer\s',           # starts with "leer"
-            r'^voir\s',           # starts with "voir"
-            r'^ver\s',            # starts with "ver"
-            r'more\s*>>?$',       # ends with "more >" or "more >>"
-            r'plus\s*>>?$',       # ends with "plus >"
-            r'más\s*>>?$',        # ends with "más >"
-            r'^\d+$',             # just numbers
-            r'^#\d+$',            # just #number
-        ]
-
-        for pattern in generic_patterns:
-            if re.search(pattern, anchor_lower):
-                return True
-
-        return False
+        return GENERIC_ANCHOR_PATTERN.search(anchor_lower) is not None
 
     def _extract_json_ld(self, soup):
         """Extract all JSON-LD structured data blocks."""
@@ -480,7 +791,8 @@ class DumbCrawlerPipeline:
             try:
                 content = script.string
                 if content:
-                    data = json.loads(content)
+                    # Plain str: orjson rejects str subclasses like bs4's Script
+                    data = json_loads(str(content))
                     if isinstance(data, list):
                         json_ld_list.extend(data)
                     else:
@@ -489,31 +801,39 @@ class DumbCrawlerPipeline:
                 pass
         return json_ld_list
 
-    def _extract_schema_types(self, json_ld_data):
-        """Extract all @type values from JSON-LD."""
-        types = []
-        def extract_types(obj):
+    def _walk_json_ld(self, json_ld_data):
+        """
+        Walk JSON-LD once, in document order.
+
+        Yields ('type', value) for each @type value and ('date', field, value)
+        for each JSON_LD_DATE_FIELDS entry, visiting nested objects up to
+        depth 10.
+        """
+        # Iterative pre-order walk; only containers are pushed
+        stack = [(obj, 0) for obj in reversed(json_ld_data) if isinstance(obj, (dict, list))]
+        while stack:
+            obj, depth = stack.pop()
+            if depth > 10:  # Prevent runaway nesting
+                continue
             if isinstance(obj, dict):
                 if '@type' in obj:
                     t = obj['@type']
-                    if isinstance(t, list):
-                        types.extend(t)
-                    else:
-                        types.append(t)
-                for value in obj.values():
-                    extract_types(value)
-            elif isinstance(obj, list):
-                for item in obj:
-                    extract_types(item)
-        for item in json_ld_data:
-            extract_types(item)
-        # Remove duplicates while preserving order
-        seen = set()
-        return [t for t in types if not (t in seen or seen.add(t))]
+                    for type_name in (t if isinstance(t, list) else (t,)):
+                        yield ('type', type_name)
+                for field in self.JSON_LD_DATE_FIELDS:
+                    if field in obj:
+                        yield ('date', field, obj[field])
+                children = obj.values()
+            else:
+                children = obj
+            stack.extend(
+                (child, depth + 1) for child in reversed(list(children))
+                if isinstance(child, (dict, list))
+            )
 
     # === CONTENT AGE EXTRACTION ===
 
-    def _extract_content_age(self, item, soup, json_ld_data):
+    def _extract_content_age(self, item, tree, json_ld_dates, meta_names, meta_properties):
         """
         Extract content age from multiple sources.
 
@@ -542,23 +862,19 @@ class DumbCrawlerPipeline:
             "modified": []
         }
 
-        # === 1. JSON-LD STRUCTURED DATA (highest priority) ===
-        self._extract_dates_from_json_ld(json_ld_data, found_dates)
-
-        # === 2. OPEN GRAPH ARTICLE TIMES ===
-        self._extract_dates_from_og(soup, found_dates)
-
-        # === 3. META TAGS ===
-        self._extract_dates_from_meta(soup, found_dates)
-
-        # === 4. HTTP HEADERS ===
-        self._extract_dates_from_headers(item, found_dates)
-
-        # === 5. HTML TIME ELEMENTS ===
-        self._extract_dates_from_time_elements(soup, found_dates)
-
-        # === 6. COMMON HTML PATTERNS ===
-        self._extract_dates_from_html_patterns(soup, found_dates)
+        date_sources = (
+            (self._extract_dates_from_json_ld, json_ld_dates),  # 1. JSON-LD (highest priority)
+            (self._extract_dates_from_og, meta_properties),  # 2. Open Graph article times
+            (self._extract_dates_from_meta, meta_names),  # 3. Meta tags
+            (self._extract_dates_from_headers, item),  # 4. HTTP headers
+            (self._extract_dates_from_time_elements, tree),  # 5. HTML <time> elements
+            (self._extract_dates_from_html_patterns, tree),  # 6. Common HTML patterns
+        )
+        for extract, source in date_sources:
+            extract(source, found_dates)
+            # Only the first date of each type is used; skip lower-priority sources
+            if found_dates["published"] and found_dates["modified"]:
+                break
 
         # Select best dates (first found = highest priority)
         if found_dates["published"]:
@@ -601,57 +917,28 @@ class DumbCrawlerPipeline:
         if not date_str:
             return None
 
-        try:
-            # Try dateutil parser (handles most formats)
-            parsed = date_parser.parse(date_str, fuzzy=True)
-            # Ensure timezone aware
-            if parsed.tzinfo is None:
-                parsed = parsed.replace(tzinfo=timezone.utc)
-            return parsed.isoformat()
-        except (ParserError, ValueError, OverflowError):
-            pass
+        return _parse_date_string(date_str)
 
-        # Try HTTP date format (RFC 2822)
-        try:
-            parsed = parsedate_to_datetime(date_str)
-            return parsed.isoformat()
-        except (ValueError, TypeError):
-            pass
-
-        return None
+    # JSON-LD date fields -> date type
+    JSON_LD_DATE_FIELDS = {
+        'datePublished': 'published',
+        'dateCreated': 'published',
+        'dateModified': 'modified',
+        'dateUpdated': 'modified',
+        'uploadDate': 'published',  # For VideoObject
+    }
 
-    def _extract_dates_from_json_ld(self, json_ld_data, found_dates):
-        """Extract dates from JSON-LD structured data."""
-        date_fields = {
-            'datePublished': 'published',
-            'dateCreated': 'published',
-            'dateModified': 'modified',
-            'dateUpdated': 'modified',
-            'uploadDate': 'published',  # For VideoObject
-        }
+    def _extract_dates_from_json_ld(self, json_ld_dates, found_dates):
+        """Extract dates from the (field, value) pairs found by _walk_json_ld."""
+        for field, value in json_ld_dates:
+            parsed = self._parse_date(value)
+            if parsed:
+                found_dates[self.JSON_LD_DATE_FIELDS[field]].append({
+                    "date": parsed,
+                    "source": f"json-ld:{field}"
+                })
 
-        def search_json_ld(obj, depth=0):
-            if depth > 10:  # Prevent infinite recursion
-                return
-            if isinstance(obj, dict):
-                for field, date_type in date_fields.items():
-                    if field in obj:
-                        parsed = self._parse_date(obj[field])
-                        if parsed:
-                            found_dates[date_type].append({
-                                "date": parsed,
-                                "source": f"json-ld:{field}"
-                            })
-                for value in obj.values():
-                    search_json_ld(value, depth + 1)
-            elif isinstance(obj, list):
-                for item in obj:
-                    search_json_ld(item, depth + 1)
-
-        for item in json_ld_data:
-            search_json_ld(item)
-
-    def _extract_dates_from_og(self, soup, found_dates):
+    def _extract_dates_from_og(self, meta_properties, found_dates):
         """Extract dates from Open Graph article tags."""
         og_date_tags = [
             ('article:published_time', 'published'),
@@ -664,7 +951,7 @@ class DumbCrawlerPipeline:
         ]
 
         for prop, date_type in og_date_tags:
-            content = self._get_meta_property(soup, prop)
+            content = meta_properties.get(prop)
             if content:
                 parsed = self._parse_date(content)
                 if parsed:
@@ -673,7 +960,7 @@ class DumbCrawlerPipeline:
                         "source": f"og:{prop}"
                     })
 
-    def _extract_dates_from_meta(self, soup, found_dates):
+    def _extract_dates_from_meta(self, meta_names, found_dates):
         """Extract dates from various meta tags."""
         meta_date_tags = [
             # Published date meta tags
@@ -699,7 +986,7 @@ class DumbCrawlerPipeline:
         ]
 
         for name, date_type in meta_date_tags:
-            content = self._get_meta_content(soup, name)
+            content = meta_names.get(name.lower())
             if content:
                 parsed = self._parse_date(content)
                 if parsed:
@@ -732,21 +1019,22 @@ class DumbCrawlerPipeline:
                     "source": "header:Date"
                 })
 
-    def _extract_dates_from_time_elements(self, soup, found_dates):
+    def _extract_dates_from_time_elements(self, tree, found_dates):
         """Extract dates from HTML <time> elements."""
-        time_elements = soup.find_all('time')
-
-        for time_el in time_elements[:10]:  # Limit to first 10
+        for time_el in TIME_XPATH(tree):  # Limit to first 10
             datetime_attr = time_el.get('datetime')
             if datetime_attr:
                 parsed = self._parse_date(datetime_attr)
                 if parsed:
                     # Try to determine if it's published or modified based on context
-                    parent_classes = ' '.join(time_el.parent.get('class', []) if time_el.parent else []).lower()
-                    el_classes = ' '.join(time_el.get('class', [])).lower()
+                    parent = time_el.getparent()
+                    parent_classes = (parent.get('class') or '') if parent is not None else ''
+                    el_classes = time_el.get('class') or ''
                     itemprop = (time_el.get('itemprop') or '').lower()
 
-                    if any(x in parent_classes + el_classes + itemprop for x in ['modified', 'updated', 'edit']):
+                    if (MODIFIED_DATE_PATTERN.search(parent_classes)
+                            or MODIFIED_DATE_PATTERN.search(el_classes)
+                            or MODIFIED_DATE_PATTERN.search(itemprop)):
                         date_type = 'modified'
                     else:
                         date_type = 'published'
@@ -755,48 +1043,41 @@ class DumbCrawlerPipeline:
                         "date": parsed,
                         "source": f"time[datetime]:{itemprop or 'element'}"
                     })
-
-    def _extract_dates_from_html_patterns(self, soup, found_dates):
-        """Extract dates from common HTML patterns."""
-        # Common class names that often contain dates
-        date_selectors = [
-            # Published
-            ('.published', 'published'),
-            ('.post-date', 'published'),
-            ('.entry-date', 'published'),
-            ('.article-date', 'published'),
-            ('.date-published', 'published'),
-            ('.publish-date', 'published'),
-            ('[itemprop="datePublished"]', 'published'),
-            ('[data-date]', 'published'),
-            # Modified
-            ('.modified', 'modified'),
-            ('.updated', 'modified'),
-            ('.last-modified', 'modified'),
-            ('.date-modified', 'modified'),
-            ('[itemprop="dateModified"]', 'modified'),
-        ]
-
-        for selector, date_type in date_selectors:
-            try:
-                elements = soup.select(selector)
-                for el in elements[:3]:  # Limit per selector
-                    # Try datetime attribute first
-                    date_str = el.get('datetime') or el.get('data-date') or el.get('content')
-                    if not date_str:
-                        # Fall back to text content
-                        date_str = el.get_text(strip=True)
-
-                    if date_str:
-                        parsed = self._parse_date(date_str)
-                        if parsed:
-                            found_dates[date_type].append({
-                                "date": parsed,
-                                "source": f"html:{selector}"
-                            })
-                            break  # Only take first match per selector
-            except Exception:
-                continue  # Skip invalid selectors
+                    if found_dates["published"] and found_dates["modified"]:
+                        return
+
+    def _extract_dates_from_html_patterns(self, tree, found_dates):
+        """Extract dates from common HTML patterns (see HTML_DATE_SELECTORS)."""
+        # One walk for all selectors, then bucket candidates per selector
+        matches = {selector: [] for selector, _ in HTML_DATE_SELECTORS}
+        for el in HTML_DATE_CANDIDATES_XPATH(tree):
+            for selector, _, is_match in HTML_DATE_MATCHERS:
+                if len(matches[selector]) < 3 and is_match(el):  # Limit per selector
+                    matches[selector].append(el)
+
+        for selector, date_type in HTML_DATE_SELECTORS:
+            for el in matches[selector]:
+                # Try datetime attribute first
+                date_str = el.get('datetime') or el.get('data-date') or el.get('content')
+                if not date_str:
+                    # Fall back to text content
+                    date_str = element_text(el, strip=True)
+
+                if date_str:
+                    parsed = self._parse_date(date_str)
+                    if parsed:
+                        found_dates[date_type].append({
+                            "date": parsed,
+                            "source": f"html:{selector}"
+                        })
+                        if found_dates["published"] and found_dates["modified"]:
+                            return
+                        break  # Only take first match per selector
+
+
+def _write_bytes(filepath, data):
+    with open(filepath, 'wb') as f:
+        f.write(data)
 
 
 class JsonFilePipeline:
@@ -805,40 +1086,129 @@ class JsonFilePipeline:
 
     Files are named based on URL hash for uniqueness.
     Output directory is configurable via CRAWL_OUTPUT_DIR setting.
+    With JSON_WRITE_THREADS > 0, items are serialized on the reactor thread
+    and written to disk by a thread pool. Output is compact unless
+    CRAWL_OUTPUT_PRETTY is enabled.
     """
 
-    def __init__(self, output_dir):
+    def __init__(self, output_dir, write_threads=0, pretty=False):
         self.output_dir = Path(output_dir)
+        self.write_threads = write_threads
+        self.pretty = pretty
+        self.file_count = 0
+        self._io_pool = None
 
     @classmethod
     def from_crawler(cls, crawler):
         output_dir = crawler.settings.get('CRAWL_OUTPUT_DIR', 'output')
-        return cls(output_dir)
+        write_threads = crawler.settings.getint('JSON_WRITE_THREADS', 0)
+        pretty = crawler.settings.getbool('CRAWL_OUTPUT_PRETTY', False)
+        return cls(output_dir, write_threads, pretty)
 
     def open_spider(self, spider):
         """Create output directory when spider starts."""
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        if self.write_threads > 0:
+            self._io_pool = ThreadPoolExecutor(max_workers=self.write_threads)
         spider.logger.info(f"JSON output directory: {self.output_dir.absolute()}")
 
     def process_item(self, item, spider):
         """Save each item as a JSON file."""
         # Generate filename from URL hash
         url = item.get('url', '')
-        url_hash = hashlib.md5(url.encode('utf-8')).hexdigest()[:12]
+        url_hash = hashlib.blake2b(url.encode('utf-8'), digest_size=6).hexdigest()
         filename = f"{url_hash}.json"
         filepath = self.output_dir / filename
 
-        # Write JSON file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(item, f, ensure_ascii=False, indent=2)
+        # Write JSON file. orjson encodes straight to bytes; the stdlib encoder
+        # is streamed chunk by chunk so the full document is never held twice.
+        if self._io_pool is not None:
+            # Serialize now, while the item is ours; only the disk write is deferred
+            future = self._io_pool.submit(_write_bytes, filepath, json_dumps(item, indent=self.pretty))
+            future.add_done_callback(partial(self._log_write_error, spider, filepath))
+        elif orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(json_dumps(item, indent=self.pretty))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                if self.pretty:
+                    json.dump(item, f, ensure_ascii=False, indent=2, default=str)
+                else:
+                    json.dump(item, f, ensure_ascii=False, separators=(',', ':'), default=str)
+        self.file_count += 1
 
         spider.logger.debug(f"Saved: {filepath}")
         return item
 
+    def _log_write_error(self, spider, filepath, future):
+        if future.exception() is not None:
+            spider.logger.error(f"Failed to save {filepath}: {future.exception()}")
+
+    def close_spider(self, spider):
+        """Wait for pending writes and log summary when spider closes."""
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
+        spider.logger.info(f"Crawl complete. {self.file_count} JSON files saved to {self.output_dir.absolute()}")
+
+
+class JsonlShardPipeline:
+    """
+    Pipeline to append items to rolling JSON Lines shard files.
+
+    An alternative to JsonFilePipeline for large crawls: one file per
+    CRAWL_SHARD_SIZE items (default 1000) instead of one file per page.
+    Shards are named items-<start time>-<n>.jsonl in CRAWL_OUTPUT_DIR.
+    """
+
+    def __init__(self, output_dir, shard_size=1000):
+        self.output_dir = Path(output_dir)
+        self.shard_size = shard_size
+        self.item_count = 0
+        self.shard_count = 0
+        self._fh = None
+        self._shard_items = 0
+        self._prefix = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        output_dir = crawler.settings.get('CRAWL_OUTPUT_DIR', 'output')
+        shard_size = crawler.settings.getint('CRAWL_SHARD_SIZE', 1000)
+        return cls(output_dir, shard_size)
+
+    def open_spider(self, spider):
+        """Create output directory when spider starts."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._prefix = f"items-{datetime.now(timezone.utc):%Y%m%dT%H%M%S}"
+        spider.logger.info(f"JSONL output directory: {self.output_dir.absolute()}")
+
+    def _open_next_shard(self):
+        if self._fh is not None:
+            self._fh.close()
+        self._fh = open(self.output_dir / f"{self._prefix}-{self.shard_count:05d}.jsonl", 'wb')
+        self.shard_count += 1
+        self._shard_items = 0
+
+    def process_item(self, item, spider):
+        """Append the item as one line to the current shard."""
+        if self._fh is None or self._shard_items >= self.shard_size:
+            self._open_next_shard()
+
+        # Compact JSON never contains a raw newline, so each item is one line
+        self._fh.write(json_dumps(item) + b'\n')
+        self._shard_items += 1
+        self.item_count += 1
+        return item
+
     def close_spider(self, spider):
-        """Log summary when spider closes."""
-        file_count = len(list(self.output_dir.glob('*.json')))
-        spider.logger.info(f"Crawl complete. {file_count} JSON files saved to {self.output_dir.absolute()}")
+        """Close the last shard and log summary when spider closes."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        spider.logger.info(
+            f"Crawl complete. {self.item_count} items saved in {self.shard_count} "
+            f"JSONL files to {self.output_dir.absolute()}"
+        )
 
 
 def serialize_item(item):
@@ -847,7 +1217,89 @@ def serialize_item(item):
 
     This function can be used standalone to serialize items.
     """
-    return json.dumps(item, ensure_ascii=False, indent=2, default=str)
+    return json_dumps(item, indent=True).decode('utf-8')
+
+
+# (field, default) pairs copied from a pipeline item into an API page, in
+# payload order. status_flag, metadata, link_locations and performance are
+# placeholders filled in by ApiPipeline._convert_to_api_format. Defaults are
+# only serialized, never mutated, so they are shared between pages.
+API_ITEM_FIELDS = (
+    # === CORE IDENTIFIERS ===
+    ("url", ""),
+    ("status_code", None),
+    ("status_flag", None),
+    ("depth", 0),
+    ("referrer", None),
+    ("crawled_at", None),
+
+    # === PAGE METRICS ===
+    ("page_size_bytes", 0),
+    ("word_count", 0),
+    ("main_content_word_count", 0),
+
+    # === CONTENT (for NLP/entity extraction) ===
+    ("body_text", ""),
+    ("main_content", ""),
+
+    # === BASIC METADATA ===
+    ("metadata", None),
+
+    # === HEADING HIERARCHY ===
+    ("h2_tags", []),
+    ("h3_tags", []),
+
+    # === SEO META TAGS ===
+    ("canonical_url", None),
+    ("meta_robots", None),
+    ("lang", None),
+    ("viewport", None),
+    ("charset", None),
+
+    # === SOCIAL META (Open Graph & Twitter) ===
+    ("og", {}),
+    ("twitter", {}),
+
+    # === IMAGES ===
+    ("images", []),
+    ("images_count", 0),
+
+    # === LINKS ===
+    ("internal_links", []),
+    ("internal_links_count", 0),
+    ("external_links", []),
+    ("external_links_count", 0),
+    ("link_locations", None),
+    ("anchor_analysis", {}),
+
+    # === STRUCTURED DATA ===
+    ("json_ld", []),
+    ("schema_types", []),
+
+    # === CONTENT AGE ===
+    ("content_age", {}),
+
+    # === TECHNICAL ===
+    ("request_headers", {}),
+    ("response_headers", {}),
+    ("performance", None),
+    ("screenshot_path", None),
+    ("raw_html", ""),
+    ("error", None),
+
+    # === GEO DATA (Generative Engine Optimization) ===
+    ("readability", {}),
+    ("content_patterns", {}),
+    ("heading_analysis", {}),
+    ("structure_elements", {}),
+    ("schema_analysis", {}),
+    ("eeat_signals", {}),
+    ("outbound_link_analysis", {}),
+    ("hreflang", {}),
+    ("temporal_signals", {}),
+    ("multimedia", {}),
+    ("ai_crawlability", {}),
+)
 
 
 class ApiPipeline:
@@ -860,15 +1312,26 @@ class ApiPipeline:
     - project_id: The project ID
     - api_key: The API key for authentication
 
-    Results are batched and sent periodically to reduce API calls.
+    Results are batched and sent periodically to reduce API calls. Batches
+    are POSTed by a single sender thread, in order, so the reactor keeps
+    crawling while a request is in flight. The sender reuses one keep-alive
+    connection, and at most MAX_PENDING_BATCHES batches wait to be sent.
+    A partial batch is also sent once it has waited API_FLUSH_INTERVAL
+    seconds (default 5; 0 disables), so slow crawls report progress steadily.
     """
 
-    def __init__(self, api_url, crawl_job_id, project_id, api_key, batch_size=50):
+    MAX_PENDING_BATCHES = 4
+
+    def __init__(self, api_url, crawl_job_id, project_id, api_key, batch_size=50, payload_format='json',
+                 compress=False, flush_interval=5.0):
         self.api_url = api_url
         self.crawl_job_id = crawl_job_id
         self.project_id = project_id
         self.api_key = api_key
         self.batch_size = batch_size
+        self.payload_format = payload_format
+        self.compress = compress
+        self.flush_interval = flush_interval
         self.items_buffer = []
         self.stats = {
             "pages_queued": 0,
@@ -876,6 +1339,11 @@ class ApiPipeline:
             "pages_errored": 0,
         }
         self._sent_running = False
+        self._sender = None
+        self._pending = []
+        self._conn = None
+        self._flush_loop = None
+        self._last_queued = time.monotonic()
 
     @classmethod
     def from_crawler(cls, crawler):
@@ -884,25 +1352,41 @@ class ApiPipeline:
         project_id = crawler.settings.get('PROJECT_ID')
         api_key = crawler.settings.get('API_KEY')
         batch_size = crawler.settings.getint('API_BATCH_SIZE', 50)
+        payload_format = crawler.settings.get('API_PAYLOAD_FORMAT', 'json')
+        compress = crawler.settings.getbool('API_GZIP', False)
+        flush_interval = crawler.settings.getfloat('API_FLUSH_INTERVAL', 5.0)
 
         if not all([api_url, crawl_job_id, project_id, api_key]):
             raise ValueError(
                 "ApiPipeline requires API_URL, CRAWL_JOB_ID, PROJECT_ID, and API_KEY settings"
             )
+        if payload_format not in ('json', 'msgpack'):
+            raise ValueError(f"Unknown API_PAYLOAD_FORMAT: {payload_format}")
+        if payload_format == 'msgpack' and msgpack is None:
+            raise ValueError("API_PAYLOAD_FORMAT = 'msgpack' requires the msgpack package")
 
-        return cls(api_url, crawl_job_id, project_id, api_key, batch_size)
+        return cls(api_url, crawl_job_id, project_id, api_key, batch_size, payload_format, compress,
+                   flush_interval)
 
     def open_spider(self, spider):
         """Send 'running' status when spider starts."""
         spider.logger.info(f"ApiPipeline: Starting crawl job {self.crawl_job_id}")
-        self._send_batch(status="running")
+        self._sender = ThreadPoolExecutor(max_workers=1)
+        self._queue_batch(status="running")
         self._sent_running = True
+        if self.flush_interval > 0:
+            self._flush_loop = task.LoopingCall(self._flush_if_idle)
+            self._flush_loop.start(self.flush_interval, now=False)
 
-    def process_item(self, item, spider):
+    def _flush_if_idle(self):
+        """Send a partial batch that has waited a full flush interval."""
+        if self.items_buffer and time.monotonic() - self._last_queued >= self.flush_interval:
+            self._queue_batch(status="running")
+
+    async def process_item(self, item, spider):
         """Buffer items and send in batches."""
-        # Convert item to API format (strip extra fields not needed)
-        api_item = self._convert_to_api_format(item)
-        self.items_buffer.append(api_item)
+        # Items are converted to API format by the sender thread at send time
+        self.items_buffer.append(item)
 
         # Track stats
         self.stats["pages_crawled"] += 1
@@ -916,13 +1400,20 @@ class ApiPipeline:
 
         # Send batch if buffer is full
         if len(self.items_buffer) >= self.batch_size:
-            self._send_batch(status="running")
-            self.items_buffer = []
+            self._queue_batch(status="running")
+            # Backpressure: don't let unsent batches pile up in memory
+            if len(self._pending) > self.MAX_PENDING_BATCHES:
+                await asyncio.wrap_future(self._pending[0])
 
         return item
 
     def close_spider(self, spider):
         """Send final batch with 'completed' status."""
+        # Returned as a Deferred so Scrapy waits for it on every supported version
+        return deferred_from_coro(self._complete_crawl(spider))
+
+    async def _complete_crawl(self, spider):
+        """Queue the final batch and wait for every batch to be sent."""
         spider.logger.info(f"ApiPipeline: Completing crawl job {self.crawl_job_id}")
 
         # For sitemap mode: ensure final pages_queued count is accurate
@@ -939,8 +1430,17 @@ class ApiPipeline:
             status = "failed"
             spider.logger.warning(f"ApiPipeline: Crawl failed - no pages crawled")
 
-        # Send remaining items with final status
-        self._send_batch(status=status)
+        if self._flush_loop is not None and self._flush_loop.running:
+            self._flush_loop.stop()
+        self._flush_loop = None
+
+        # Send remaining items with final status, after every earlier batch
+        self._queue_batch(status=status)
+        await asyncio.gather(*(asyncio.wrap_future(f) for f in self._pending))
+        self._sender.shutdown(wait=True)
+        self._sender = None
+        self._pending = []
+        self._close_connection()
         spider.logger.info(
             f"ApiPipeline: Sent {self.stats['pages_crawled']} pages "
             f"({self.stats['pages_errored']} errors)"
@@ -948,8 +1448,10 @@ class ApiPipeline:
 
     def _convert_to_api_format(self, item):
         """Convert pipeline item to API format with all fundamental fields."""
+        api_item = {field: item.get(field, default) for field, default in API_ITEM_FIELDS}
+
         # Determine status_flag from status_code
-        status_code = item.get("status_code")
+        status_code = api_item["status_code"]
         if status_code:
             if 200 <= status_code < 300:
                 status_flag = "ok"
@@ -963,102 +1465,32 @@ class ApiPipeline:
                 status_flag = "not_crawled"
         else:
             status_flag = "not_crawled"
-
-        return {
-            # === CORE IDENTIFIERS ===
-            "url": item.get("url", ""),
-            "status_code": status_code,
-            "status_flag": status_flag,  # Add status_flag for frontend filtering
-            "depth": item.get("depth", 0),
-            "referrer": item.get("referrer"),
-            "crawled_at": item.get("crawled_at"),
-
-            # === PAGE METRICS ===
-            "page_size_bytes": item.get("page_size_bytes", 0),
-            "word_count": item.get("word_count", 0),
-            "main_content_word_count": item.get("main_content_word_count", 0),
-
-            # === CONTENT (for NLP/entity extraction) ===
-            "body_text": item.get("body_text", ""),
-            "main_content": item.get("main_content", ""),
-
-            # === BASIC METADATA ===
-            "metadata": {
-                "title": item.get("metadata", {}).get("title"),
-                "meta_description": item.get("metadata", {}).get("meta_description"),
-                "h1": item.get("metadata", {}).get("h1"),
-            },
-
-            # === HEADING HIERARCHY ===
-            "h2_tags": item.get("h2_tags", []),
-            "h3_tags": item.get("h3_tags", []),
-
-            # === SEO META TAGS ===
-            "canonical_url": item.get("canonical_url"),
-            "meta_robots": item.get("meta_robots"),
-            "lang": item.get("lang"),
-            "viewport": item.get("viewport"),
-            "charset": item.get("charset"),
-
-            # === SOCIAL META (Open Graph & Twitter) ===
-            "og": item.get("og", {}),
-            "twitter": item.get("twitter", {}),
-
-            # === IMAGES ===
-            "images": item.get("images", []),
-            "images_count": item.get("images_count", 0),
-
-            # === LINKS ===
-            "internal_links": item.get("internal_links", []),
-            "internal_links_count": item.get("internal_links_count", 0),
-            "external_links": item.get("external_links", []),
-            "external_links_count": item.get("external_links_count", 0),
-            "link_locations": item.get("link_locations", {
+        api_item["status_flag"] = status_flag  # Add status_flag for frontend filtering
+
+        # Nested fields only carry a subset of the item's keys
+        metadata = item.get("metadata", {})
+        api_item["metadata"] = {
+            "title": metadata.get("title"),
+            "meta_description": metadata.get("meta_description"),
+            "h1": metadata.get("h1"),
+        }
+        if "link_locations" not in item:
+            api_item["link_locations"] = {
                 "nav": {"count": 0, "links": []},
                 "header": {"count": 0, "links": []},
                 "footer": {"count": 0, "links": []},
                 "aside": {"count": 0, "links": []},
                 "main": {"count": 0, "links": []},
-            }),
-            "anchor_analysis": item.get("anchor_analysis", {}),
-
-            # === STRUCTURED DATA ===
-            "json_ld": item.get("json_ld", []),
-            "schema_types": item.get("schema_types", []),
-
-            # === CONTENT AGE ===
-            "content_age": item.get("content_age", {}),
-
-            # === TECHNICAL ===
-            "request_headers": item.get("request_headers", {}),
-            "response_headers": item.get("response_headers", {}),
-            "performance": {
-                "download_latency_s": item.get("performance", {}).get("download_latency_s"),
-                "timing": item.get("performance", {}).get("timing"),
-            },
-            "screenshot_path": item.get("screenshot_path"),
-            "raw_html": item.get("raw_html", ""),
-            "error": item.get("error"),
-
-            # === GEO DATA (Generative Engine Optimization) ===
-            "readability": item.get("readability", {}),
-            "content_patterns": item.get("content_patterns", {}),
-            "heading_analysis": item.get("heading_analysis", {}),
-            "structure_elements": item.get("structure_elements", {}),
-            "schema_analysis": item.get("schema_analysis", {}),
-            "eeat_signals": item.get("eeat_signals", {}),
-            "outbound_link_analysis": item.get("outbound_link_analysis", {}),
-            "hreflang": item.get("hreflang", {}),
-            "temporal_signals": item.get("temporal_signals", {}),
-            "multimedia": item.get("multimedia", {}),
-            "ai_crawlability": item.get("ai_crawlability", {}),
+            }
+        performance = item.get("performance", {})
+        api_item["performance"] = {
+            "download_latency_s": performance.get("download_latency_s"),
+            "timing": performance.get("timing"),
         }
+        return api_item
 
-    def _send_batch(self, status="running"):
-        """Send batch of items to API."""
-        import urllib.request
-        import urllib.error
-
+    def _queue_batch(self, status="running"):
+        """Hand the buffered items to the sender thread and start a new buffer."""
         payload = {
             "crawl_job_id": self.crawl_job_id,
             "project_id": self.project_id,
@@ -1067,34 +1499,99 @@ class ApiPipeline:
             "pages": self.items_buffer,
             "stats": self.stats.copy(),
         }
+        self.items_buffer = []
+        self._last_queued = time.monotonic()
+        self._pending = [f for f in self._pending if not f.done()]
+        self._pending.append(self._sender.submit(self._send_batch, payload))
+
+    def _get_connection(self):
+        """Return the sender thread's keep-alive connection, opening it if needed."""
+        if self._conn is not None and self._conn.sock is not None:
+            # An idle keep-alive socket should have nothing to read; if it does,
+            # the server closed it, so drop it before sending anything on it
+            readable, _, _ = select.select([self._conn.sock], [], [], 0)
+            if readable:
+                self._close_connection()
+        if self._conn is None:
+            parsed = urlparse(self.api_url)
+            conn_cls = http.client.HTTPSConnection if parsed.scheme == 'https' else http.client.HTTPConnection
+            self._conn = conn_cls(parsed.netloc, timeout=30)
+        return self._conn
+
+    def _close_connection(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _send_batch(self, payload):
+        """Send batch of items to API (runs on the sender thread)."""
+        # Convert items to API format (strip extra fields not needed)
+        payload["pages"] = [self._convert_to_api_format(item) for item in payload["pages"]]
+
+        parsed = urlparse(self.api_url)
+        path = parsed.path or '/'
+        if parsed.query:
+            path += '?' + parsed.query
 
         try:
-            data = json.dumps(payload).encode('utf-8')
-            req = urllib.request.Request(
-                self.api_url,
-                data=data,
-                headers={
-                    'Content-Type': 'application/json',
-                    'User-Agent': 'DumbCrawler/2.0',
-                },
-                method='POST'
-            )
-
-            with urllib.request.urlopen(req, timeout=30) as response:
-                response_data = json.loads(response.read().decode('utf-8'))
-                if response_data.get("success"):
-                    return True
-                else:
-                    print(f"API error: {response_data.get('error')}")
+            if self.payload_format == 'msgpack':
+                data = msgpack.packb(payload, use_bin_type=True, default=str)
+                content_type = 'application/msgpack'
+            else:
+                data = json_dumps(payload)
+                content_type = 'application/json'
+            headers = {
+                'Content-Type': content_type,
+                'User-Agent': 'DumbCrawler/2.0',
+            }
+            if self.compress:
+                # Repeated keys and page text compress well; level 6 is a
+                # good size/CPU trade-off for batches of a few MB
+                data = gzip.compress(data, compresslevel=6)
+                headers['Content-Encoding'] = 'gzip'
+
+            # The connection is kept alive across batches; if sending on a
+            # reused one fails, retry once on a fresh one
+            for attempt in range(2):
+                reused = self._conn is not None
+                try:
+                    conn = self._get_connection()
+                    conn.request('POST', path, body=data, headers=headers)
+                    break
+                except (http.client.HTTPException, ConnectionError) as e:
+                    self._close_connection()
+                    if not reused or attempt:
+                        print(f"URL error: {e}")
+                        return False
+                except OSError as e:
+                    self._close_connection()
+                    print(f"URL error: {e}")
                     return False
 
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode('utf-8') if e.fp else str(e)
-            print(f"HTTP error {e.code}: {error_body}")
-            return False
-        except urllib.error.URLError as e:
-            print(f"URL error: {e.reason}")
-            return False
+            # The server may already have the batch, and the API is not
+            # idempotent, so a failure from here on is never retried
+            try:
+                response = conn.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError) as e:
+                self._close_connection()
+                print(f"URL error: {e}")
+                return False
+
+            if response.will_close:
+                self._close_connection()
+
+            if response.status >= 400:
+                print(f"HTTP error {response.status}: {body.decode('utf-8', 'replace')}")
+                return False
+
+            response_data = json_loads(body)  # Both parsers accept UTF-8 bytes
+            if response_data.get("success"):
+                return True
+            else:
+                print(f"API error: {response_data.get('error')}")
+                return False
+
         except Exception as e:
             print(f"Error sending batch to API: {e}")
             return False
@@ -12,12 +12,22 @@ USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTM
 ROBOTSTXT_OBEY = False
 
 # ==============================================================================
-# CONCURRENCY SETTINGS (reduced for bot protection bypass)
+# CONCURRENCY SETTINGS (per-domain kept low for bot protection bypass)
 # ==============================================================================
-CONCURRENT_REQUESTS = 2
+CONCURRENT_REQUESTS = 8  # Lets crawls spanning several (sub)domains fetch in parallel
 CONCURRENT_REQUESTS_PER_DOMAIN = 2
 CONCURRENT_REQUESTS_PER_IP = 0  # 0 means use CONCURRENT_REQUESTS_PER_DOMAIN
 
+# Hand out requests from the least busy download slot first, so one domain's
+# backlog (e.g. a large sitemap) doesn't leave other slots idle
+SCHEDULER_PRIORITY_QUEUE = "scrapy.pqueues.DownloaderAwarePriorityQueue"
+
+# DNS resolution runs in the reactor thread pool; cache lookups and fail fast
+REACTOR_THREADPOOL_MAXSIZE = 20
+DNSCACHE_ENABLED = True
+DNSCACHE_SIZE = 100000
+DNS_TIMEOUT = 10
+
 # ==============================================================================
 # TIMEOUT SETTINGS
 # ==============================================================================
@@ -31,7 +41,7 @@ RANDOMIZE_DOWNLOAD_DELAY = True
 AUTOTHROTTLE_ENABLED = True
 AUTOTHROTTLE_START_DELAY = 2
 AUTOTHROTTLE_MAX_DELAY = 10
-AUTOTHROTTLE_TARGET_CONCURRENCY = 1.0
+AUTOTHROTTLE_TARGET_CONCURRENCY = 2.0  # Up to CONCURRENT_REQUESTS_PER_DOMAIN
 
 # ==============================================================================
 # PLAYWRIGHT DOWNLOAD HANDLER
@@ -69,11 +79,12 @@ PLAYWRIGHT_LAUNCH_OPTIONS = {
 # Default navigation timeout in milliseconds (None = use Playwright default 30s)
 PLAYWRIGHT_DEFAULT_NAVIGATION_TIMEOUT = 30000  # 30 seconds
 
-# Maximum concurrent pages per browser context
-PLAYWRIGHT_MAX_PAGES_PER_CONTEXT = 4
+# Maximum concurrent pages per browser context (all requests share the warm
+# "default" context, so this matches CONCURRENT_REQUESTS)
+PLAYWRIGHT_MAX_PAGES_PER_CONTEXT = 8
 
 # Maximum concurrent browser contexts (None = no limit)
-PLAYWRIGHT_MAX_CONTEXTS = None
+PLAYWRIGHT_MAX_CONTEXTS = 4
 
 # Restart browser if disconnected
 PLAYWRIGHT_RESTART_DISCONNECTED_BROWSER = True
@@ -111,12 +122,34 @@ ITEM_PIPELINES = {
     "dumbcrawler.pipelines.JsonFilePipeline": 400,
 }
 
+# Worker processes for HTML metadata extraction in DumbCrawlerPipeline
+# (0 = run inline on the reactor thread; e.g. os.cpu_count() to use all cores)
+EXTRACTION_WORKERS = 0
+
+# Threads for running a page's GEO extractors concurrently (inline mode only;
+# 0 = sequential). Extractors are mostly pure Python, so gains are GIL-bound.
+EXTRACTOR_THREADS = 0
+
+# Replace raw_html with raw_html_sha256 once metadata is extracted, to cut
+# per-item memory (JSON output and API payloads then carry no HTML)
+DROP_RAW_HTML = False
+
 # ==============================================================================
 # OUTPUT SETTINGS
 # ==============================================================================
 # Directory for JSON output files
 CRAWL_OUTPUT_DIR = "output"
 
+# Indent JSON output files (compact by default: smaller and faster to write)
+CRAWL_OUTPUT_PRETTY = False
+
+# Threads that write JSON files in the background (0 = write inline)
+JSON_WRITE_THREADS = 4
+
+# Items per file when "dumbcrawler.pipelines.JsonlShardPipeline" is used in
+# place of JsonFilePipeline (rolling JSONL shards instead of one file per page)
+CRAWL_SHARD_SIZE = 1000
+
 # ==============================================================================
 # OTHER SETTINGS
 # ==============================================================================
@@ -1,12 +1,203 @@
 import re
 import os
+import time
 import hashlib
+import struct
+from io import BytesIO
+from functools import lru_cache
 import scrapy
 from scrapy.http import Request, Response
 from scrapy.linkextractors import LinkExtractor
 from scrapy_playwright.page import PageMethod
+from lxml import etree
 from urllib.parse import urlparse, urljoin
-from typing import List, Optional, Generator, Set, Dict, Any
+from typing import List, Optional, Generator, Set, Dict, Any, Tuple
+
+# python-isal (ISA-L) inflates gzipped sitemaps several times faster than
+# zlib; optional, Scrapy's gunzip is used without it
+try:
+    from isal import igzip, isal_zlib
+except ImportError:
+    igzip = isal_zlib = None
+
+# Content-Type substrings of responses worth saving (HTML, XML, JSON, plain text)
+TEXT_CONTENT_TYPES = (b'text/', b'application/xhtml', b'application/xml', b'application/json')
+
+# Non-HTML file extensions the crawl-mode link extractor never follows
+DENY_EXTENSIONS = frozenset({
+    # Images
+    'jpg', 'jpeg', 'png', 'gif', 'bmp', 'svg', 'webp', 'ico', 'tiff', 'tif',
+    # Documents
+    'pdf', 'doc', 'docx', 'xls', 'xlsx', 'ppt', 'pptx', 'odt', 'ods', 'odp',
+    # Archives
+    'zip', 'rar', 'tar', 'gz', '7z', 'bz2',
+    # Media
+    'mp3', 'mp4', 'avi', 'mov', 'wmv', 'flv', 'wav', 'ogg', 'webm',
+    # Other binary
+    'exe', 'dmg', 'iso', 'bin', 'dll', 'so',
+    # Data files
+    'json', 'xml', 'csv', 'txt',
+})
+
+# Page metadata lookups, compiled once (first match in document order)
+TITLE_XPATH = etree.XPath('(//title/text())[1]', smart_strings=False)
+META_DESCRIPTION_XPATH = etree.XPath('(//meta[@name="description"]/@content)[1]', smart_strings=False)
+OG_DESCRIPTION_XPATH = etree.XPath('(//meta[@property="og:description"]/@content)[1]', smart_strings=False)
+H1_TEXT_XPATH = etree.XPath('(//h1/text())[1]', smart_strings=False)
+H1_ALL_TEXT_XPATH = etree.XPath('//h1//text()', smart_strings=False)
+
+# Page sections _extract_link_locations sorts links into by their ancestors
+LINK_SECTION_TAGS = ("nav", "header", "footer", "aside", "main", "article", "body")
+# Sections reported in an item's link_locations
+LINK_LOCATION_SECTIONS = ("nav", "header", "footer", "aside", "main")
+# Links under any of these are not main content when falling back to <body>
+NON_MAIN_SECTION_TAGS = frozenset({"nav", "header", "footer", "aside"})
+# First text node within a link, as a.css("::text").get() returned
+LINK_TEXT_XPATH = etree.XPath('string((descendant-or-self::text())[1])')
+
+# Navigation timing collected in the browser after each Playwright page load
+PERF_TIMING_JS = """() => {
+    const timing = performance.timing;
+    const navigation = performance.getEntriesByType('navigation')[0] || {};
+    return {
+        dns_lookup_ms: timing.domainLookupEnd - timing.domainLookupStart,
+        tcp_connect_ms: timing.connectEnd - timing.connectStart,
+        ttfb_ms: timing.responseStart - timing.requestStart,
+        dom_load_ms: timing.domContentLoadedEventEnd - timing.navigationStart,
+        full_load_ms: timing.loadEventEnd - timing.navigationStart,
+        dom_interactive_ms: timing.domInteractive - timing.navigationStart,
+        transfer_size: navigation.transferSize || 0,
+        encoded_body_size: navigation.encodedBodySize || 0,
+        decoded_body_size: navigation.decodedBodySize || 0,
+    };
+}"""
+
+# scheme://netloc/path?query#fragment for plain absolute URLs with an ASCII
+# host. Anything else (whitespace, control chars, IPv6 brackets, IDN hosts,
+# ;params) goes through urlparse.
+URL_PATTERN = re.compile(r'([a-zA-Z][a-zA-Z0-9+.-]*)://([^/?#\[\]\x00-\x20\x7f-\U0010ffff]*)(/[^?#;\x00-\x20]*)?(?:\?([^#\x00-\x20]*))?(?:#[^\x00-\x20]*)?')
+
+
+@lru_cache(maxsize=65536)
+def _split_url(url: str) -> Tuple[str, str, str, str]:
+    """Split a URL into (scheme, netloc, path, query) like urlparse, caching results."""
+    match = URL_PATTERN.fullmatch(url)
+    if match:
+        scheme, netloc, path, query = match.groups()
+        return scheme.lower(), netloc, path or "", query or ""
+    parsed = urlparse(url)
+    return parsed.scheme, parsed.netloc, parsed.path, parsed.query
+
+
+@lru_cache(maxsize=16384)
+def _split_netloc(netloc: str) -> Tuple[str, str]:
+    """
+    Split a netloc into (root domain, subdomain) on its last two dots, e.g.
+    'www.example.com' -> ('example.com', 'www'). Netlocs with fewer than
+    three labels are all domain.
+    """
+    last_dot = netloc.rfind(".")
+    if last_dot < 0:
+        return netloc, ""
+    second_dot = netloc.rfind(".", 0, last_dot)
+    if second_dot < 0:
+        return netloc, ""
+    return netloc[second_dot + 1:], netloc[:second_dot]
+
+
+def _empty_link_locations() -> Dict[str, Dict[str, Any]]:
+    """Link-location result with no links, fresh for each item (pipelines may mutate it)."""
+    return {section: {"count": 0, "links": []} for section in LINK_LOCATION_SECTIONS}
+
+
+def _link_data(a: Any) -> Dict[str, Optional[str]]:
+    """Link record for _extract_link_locations: href and first text (max 100 chars)."""
+    text = LINK_TEXT_XPATH(a)
+    return {"url": a.get("href"), "anchor": text.strip()[:100] if text else ""}
+
+
+def _isal_gunzip(data: bytes, max_size: int) -> bytes:
+    """
+    scrapy.utils.gz.gunzip on ISA-L's GzipFile: output past max_size (0 = no
+    limit) raises _DecompressionMaxSizeExceeded, and truncated or corrupt
+    input returns whatever was decompressed before the error.
+    """
+    from scrapy.utils._compression import _DecompressionMaxSizeExceeded
+
+    gzip_file = igzip.GzipFile(fileobj=BytesIO(data))
+    output = BytesIO()
+    size = 0
+    chunk = b"."
+    while chunk:
+        try:
+            chunk = gzip_file.read1(65536)
+        except (OSError, EOFError, struct.error, isal_zlib.error):
+            if output.tell():
+                break
+            raise
+        size += len(chunk)
+        if max_size and size > max_size:
+            raise _DecompressionMaxSizeExceeded(size, max_size)
+        output.write(chunk)
+    return output.getvalue()
+
+
+def _local_name(elem: Any) -> str:
+    """Tag name without its namespace ('' for comments and processing instructions)."""
+    tag = elem.tag
+    if not isinstance(tag, str):
+        return ""
+    return tag.rpartition("}")[2]
+
+
+class StreamingSitemap:
+    """
+    Sitemap (type=urlset) and sitemap index (type=sitemapindex) parser that
+    streams entries with lxml iterparse, freeing each <url>/<sitemap> element
+    once yielded so memory stays flat however large the sitemap is.
+
+    Entries match scrapy.utils.sitemap.Sitemap: child tag -> stripped text,
+    with xhtml:link hrefs collected under 'alternate'; entries without a
+    <loc> are skipped. Malformed XML is recovered where possible.
+    """
+
+    def __init__(self, body: bytes):
+        self._events = etree.iterparse(
+            BytesIO(body),
+            events=("start", "end"),
+            recover=True,
+            remove_comments=True,
+            remove_pis=True,
+            resolve_entities=False,
+            no_network=True,
+        )
+        _, root = next(self._events)
+        self.type = _local_name(root)
+
+    def __iter__(self) -> Generator[Dict[str, Any], None, None]:
+        for event, elem in self._events:
+            if event != "end" or _local_name(elem) not in ("url", "sitemap"):
+                continue
+
+            entry: Dict[str, Any] = {}
+            for child in elem:
+                name = _local_name(child)
+                if name == "link":
+                    href = child.get("href")
+                    if href:
+                        entry.setdefault("alternate", []).append(href)
+                elif name:
+                    entry[name] = child.text.strip() if child.text else ""
+
+            # Drop the element and its already-processed siblings
+            elem.clear()
+            parent = elem.getparent()
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+            if "loc" in entry:
+                yield entry
 
 
 class DumbCrawlerSpider(scrapy.Spider):
@@ -28,6 +219,7 @@ class DumbCrawlerSpider(scrapy.Spider):
     SITEMAP_REQUEST_TIMEOUT = 30  # seconds - prevent slowloris attacks
     SITEMAP_MAX_RECURSION_DEPTH = 5  # levels - prevent infinite recursion
     SITEMAP_MAX_URLS = 100000  # maximum URLs to extract from sitemaps
+    DNS_CACHE_TTL = 300  # seconds to trust a private-IP check for a hostname
 
     # Spider arguments with defaults
     # --mode: single | list | crawl | sitemap
@@ -75,33 +267,52 @@ class DumbCrawlerSpider(scrapy.Spider):
         if self.js_mode not in ("off", "auto", "full"):
             raise ValueError(f"Invalid js_mode: {js_mode}. Must be: off, auto, or full")
 
+        # Whether requests go through Playwright, fixed by the JS mode:
+        # - off: never (fastest, for static HTML sites)
+        # - full: always (slowest, for JS-heavy sites)
+        # - auto: also always, so initial loads get JS-rendered content
+        self._use_playwright = self.js_mode != "off"
+
         # Parse sitemap alternate links setting
         self.sitemap_alternate_links = sitemap_alternate_links.lower() in ("true", "1", "yes")
 
         # Store parsed base URL info for scope checking
         self._base_urls_info = [self._parse_url_info(url) for url in self.start_urls]
 
+        # Scope lookups built once: root domains, exact netlocs, and for
+        # subfolder scopes each netloc's base paths (no trailing slash) plus
+        # the prefixes of paths under them ("" for a root base path, which
+        # admits everything)
+        self._scope_domains = frozenset(info["domain"] for info in self._base_urls_info)
+        self._scope_netlocs = frozenset(info["netloc"] for info in self._base_urls_info)
+        self._scope_paths: Dict[str, Set[str]] = {}
+        self._scope_path_prefixes: Dict[str, Tuple[str, ...]] = {}
+        for info in self._base_urls_info:
+            netloc, base_path = info["netloc"], info["path"]
+            self._scope_paths.setdefault(netloc, set()).add(base_path)
+            prefix = base_path + "/" if base_path else ""
+            self._scope_path_prefixes[netloc] = self._scope_path_prefixes.get(netloc, ()) + (prefix,)
+
+        # Check if a URL is within the configured scope, specialized once:
+        # - subdomain: URL must have same full netloc (e.g., www.example.com)
+        # - domain: URL must have same root domain (e.g., *.example.com)
+        # - subfolder / subdomain+subfolder: same full netloc and under the base path
+        self._is_url_in_scope = {
+            "subdomain": self._is_url_in_subdomain_scope,
+            "domain": self._is_url_in_domain_scope,
+            "subfolder": self._is_url_in_subfolder_scope,
+            "subdomain+subfolder": self._is_url_in_subfolder_scope,
+        }[self.scope]
+
         # Link extractor for crawl mode - deny non-HTML file extensions
-        self.link_extractor = LinkExtractor(
-            deny_extensions=[
-                # Images
-                'jpg', 'jpeg', 'png', 'gif', 'bmp', 'svg', 'webp', 'ico', 'tiff', 'tif',
-                # Documents
-                'pdf', 'doc', 'docx', 'xls', 'xlsx', 'ppt', 'pptx', 'odt', 'ods', 'odp',
-                # Archives
-                'zip', 'rar', 'tar', 'gz', '7z', 'bz2',
-                # Media
-                'mp3', 'mp4', 'avi', 'mov', 'wmv', 'flv', 'wav', 'ogg', 'webm',
-                # Other binary
-                'exe', 'dmg', 'iso', 'bin', 'dll', 'so',
-                # Data files
-                'json', 'xml', 'csv', 'txt',
-            ],
-            unique=True,
-        )
+        self.link_extractor = LinkExtractor(deny_extensions=DENY_EXTENSIONS, unique=True)
+
+        # Track visited URLs to avoid duplicates, as 64-bit fingerprints of the
+        # normalized URL (see _visited_key) rather than full URL strings
+        self._visited_urls: Set[int] = set()
 
-        # Track visited URLs to avoid duplicates
-        self._visited_urls: Set[str] = set()
+        # SSRF check results: hostname -> (is_private, expiry on time.monotonic())
+        self._dns_cache: Dict[str, Tuple[bool, float]] = {}
 
         # Security: Track sitemap URL extraction count
         self._sitemap_url_count = 0  # Track total URLs extracted from sitemaps
@@ -109,6 +320,7 @@ class DumbCrawlerSpider(scrapy.Spider):
         # Screenshot settings - get output dir from settings
         self._screenshot_enabled = self.js_mode != "off"
         self._screenshot_dir: Optional[str] = None  # Set from settings in start_requests
+        self._screenshot_prefix: Optional[str] = None  # _screenshot_dir + os.sep, for building paths
 
         self.logger.info(f"DumbCrawler initialized:")
         self.logger.info(f"  Mode: {self.crawl_mode}")
@@ -133,17 +345,24 @@ class DumbCrawlerSpider(scrapy.Spider):
         Check if hostname resolves to a private IP address.
         Returns True if the hostname resolves to a private/internal IP.
         Used for SSRF protection (prevents DNS rebinding attacks).
+        Successful lookups are cached for DNS_CACHE_TTL seconds.
         """
         import socket
         import ipaddress
 
+        entry = self._dns_cache.get(hostname)
+        if entry and entry[1] > time.monotonic():
+            return entry[0]
+
         try:
             # Resolve hostname to IP address
             ip_str = socket.gethostbyname(hostname)
             ip = ipaddress.ip_address(ip_str)
 
             # Check if IP is private, loopback, or link-local
-            return ip.is_private or ip.is_loopback or ip.is_link_local
+            is_private = ip.is_private or ip.is_loopback or ip.is_link_local
+            self._dns_cache[hostname] = (is_private, time.monotonic() + self.DNS_CACHE_TTL)
+            return is_private
         except Exception as e:
             self.logger.error(f"Failed to resolve hostname {hostname}: {e}")
             # Fail closed - treat as private if we can't resolve
@@ -172,28 +391,23 @@ class DumbCrawlerSpider(scrapy.Spider):
 
     def _parse_url_info(self, url: str) -> dict:
         """Extract URL components for scope checking."""
-        parsed = urlparse(url)
+        scheme, netloc, path, _ = _split_url(url)
+        domain, subdomain = _split_netloc(netloc)
         return {
-            "scheme": parsed.scheme,
-            "netloc": parsed.netloc,
-            "domain": self._get_domain(parsed.netloc),
-            "subdomain": self._get_subdomain(parsed.netloc),
-            "path": parsed.path.rstrip("/"),
+            "scheme": scheme,
+            "netloc": netloc,
+            "domain": domain,
+            "subdomain": subdomain,
+            "path": path.rstrip("/"),
         }
 
     def _get_domain(self, netloc: str) -> str:
         """Extract root domain from netloc (e.g., 'www.example.com' -> 'example.com')."""
-        parts = netloc.split(".")
-        if len(parts) >= 2:
-            return ".".join(parts[-2:])
-        return netloc
+        return _split_netloc(netloc)[0]
 
     def _get_subdomain(self, netloc: str) -> str:
         """Extract subdomain from netloc (e.g., 'www.example.com' -> 'www')."""
-        parts = netloc.split(".")
-        if len(parts) > 2:
-            return ".".join(parts[:-2])
-        return ""
+        return _split_netloc(netloc)[1]
 
     def _get_sitemap_body(self, response: Response) -> Optional[bytes]:
         """
@@ -220,6 +434,8 @@ class DumbCrawlerSpider(scrapy.Spider):
                 try:
                     # Decompress with size limits from settings
                     max_size = getattr(self, '_max_sitemap_size', 10 * 1024 * 1024)  # 10MB default
+                    if isal_zlib is not None:
+                        return _isal_gunzip(response.body, max_size)
                     return gunzip(response.body, max_size=max_size)
                 except _DecompressionMaxSizeExceeded:
                     self.logger.error(f"Sitemap {response.url} exceeds maximum decompressed size")
@@ -255,7 +471,7 @@ class DumbCrawlerSpider(scrapy.Spider):
 
         Applies scope filtering and deduplication.
         """
-        from scrapy.utils.sitemap import Sitemap, sitemap_urls_from_robots
+        from scrapy.utils.sitemap import sitemap_urls_from_robots
 
         # Special handling for robots.txt
         if response.url.endswith('/robots.txt'):
@@ -263,7 +479,11 @@ class DumbCrawlerSpider(scrapy.Spider):
             try:
                 for sitemap_url in sitemap_urls_from_robots(response.text, base_url=response.url):
                     self.logger.info(f"Found sitemap in robots.txt: {sitemap_url}")
-                    yield Request(sitemap_url, callback=self._parse_sitemap)
+                    yield Request(
+                        sitemap_url,
+                        callback=self._parse_sitemap,
+                        meta={'download_timeout': self.SITEMAP_REQUEST_TIMEOUT},
+                    )
             except Exception as e:
                 self.logger.error(f"Failed to parse robots.txt {response.url}: {e}")
             return
@@ -276,7 +496,7 @@ class DumbCrawlerSpider(scrapy.Spider):
 
         # Parse sitemap XML
         try:
-            sitemap = Sitemap(body)
+            sitemap = StreamingSitemap(body)
         except Exception as e:
             self.logger.error(f"Failed to parse sitemap XML {response.url}: {e}")
             return
@@ -312,7 +532,10 @@ class DumbCrawlerSpider(scrapy.Spider):
                     loc,
                     callback=self._parse_sitemap,
                     priority=10,
-                    meta={'sitemap_depth': current_depth + 1}  # Security: Increment depth
+                    meta={
+                        'sitemap_depth': current_depth + 1,  # Security: Increment depth
+                        'download_timeout': self.SITEMAP_REQUEST_TIMEOUT,
+                    }
                 )
 
             self.logger.info(f"Sitemap index contains {sitemap_count} sitemaps")
@@ -338,14 +561,20 @@ class DumbCrawlerSpider(scrapy.Spider):
 
                     url = url.strip()
 
+                    # Only http(s) URLs are crawlable; a prefix test rejects
+                    # other schemes before the URL is split for the scope check
+                    if not url[:8].lower().startswith(('http://', 'https://')):
+                        skipped_scope += 1
+                        continue
+
                     # Apply scope filtering
                     if not self._is_url_in_scope(url):
                         skipped_scope += 1
                         continue
 
                     # Check for duplicates
-                    normalized_url = self._normalize_url(url)
-                    if normalized_url in self._visited_urls:
+                    visited_key = self._visited_key(url)
+                    if visited_key in self._visited_urls:
                         skipped_duplicate += 1
                         continue
 
@@ -358,7 +587,7 @@ class DumbCrawlerSpider(scrapy.Spider):
                         return
 
                     # Mark as visited
-                    self._visited_urls.add(normalized_url)
+                    self._visited_urls.add(visited_key)
                     url_count += 1
                     self._sitemap_url_count += 1
 
@@ -410,6 +639,7 @@ class DumbCrawlerSpider(scrapy.Spider):
             output_dir = self.crawler.settings.get('CRAWL_OUTPUT_DIR', 'output')
             self._screenshot_dir = os.path.join(output_dir, 'screenshots')
             os.makedirs(self._screenshot_dir, exist_ok=True)
+            self._screenshot_prefix = self._screenshot_dir + os.sep
             self.logger.info(f"Screenshots enabled, saving to: {self._screenshot_dir}")
 
         # Handle sitemap mode: parse sitemaps to extract URLs
@@ -417,11 +647,6 @@ class DumbCrawlerSpider(scrapy.Spider):
             self.logger.info(f"Starting sitemap mode with {len(self.start_urls)} sitemap URL(s)")
             self.logger.info(f"Security limits: timeout={self.SITEMAP_REQUEST_TIMEOUT}s, max_depth={self.SITEMAP_MAX_RECURSION_DEPTH}, max_urls={self.SITEMAP_MAX_URLS}")
 
-            # Security: Configure download timeout for sitemap requests
-            self.custom_settings = {
-                'DOWNLOAD_TIMEOUT': self.SITEMAP_REQUEST_TIMEOUT,
-            }
-
             for sitemap_url in self.start_urls:
                 # Security: Validate sitemap URL before fetching (SSRF + DNS rebinding protection)
                 is_valid, error_msg = self._validate_sitemap_url_security(sitemap_url)
@@ -438,26 +663,37 @@ class DumbCrawlerSpider(scrapy.Spider):
                     errback=self.handle_error,
                     priority=100,  # High priority for sitemap fetching
                     dont_filter=True,
-                    meta={'sitemap_depth': 0}  # Security: Track recursion depth
+                    meta={
+                        'sitemap_depth': 0,  # Security: Track recursion depth
+                        'download_timeout': self.SITEMAP_REQUEST_TIMEOUT,
+                    }
                 )
 
         # Handle other modes: single, list, crawl
         else:
             for url in self.start_urls:
                 # Mark start URLs as visited
-                normalized_url = self._normalize_url(url)
-                self._visited_urls.add(normalized_url)
+                self._visited_urls.add(self._visited_key(url))
                 yield self._make_request(url, depth=0, referrer=None, dont_filter=True)
 
     def _normalize_url(self, url: str) -> str:
         """Normalize URL for consistent duplicate detection."""
-        parsed = urlparse(url)
+        scheme, netloc, path, query = _split_url(url)
         # Normalize: lowercase scheme and netloc, remove trailing slash from path
-        normalized = f"{parsed.scheme.lower()}://{parsed.netloc.lower()}{parsed.path.rstrip('/')}"
-        if parsed.query:
-            normalized += f"?{parsed.query}"
+        normalized = f"{scheme}://{netloc.lower()}{path.rstrip('/')}"
+        if query:
+            normalized += f"?{query}"
         return normalized
 
+    def _visited_key(self, url: str) -> int:
+        """
+        Fingerprint a URL for the visited set: the first 8 bytes of a blake2b
+        digest of the normalized URL. An int takes a fraction of the memory of
+        a long URL string, and collisions are negligible at crawl scale.
+        """
+        digest = hashlib.blake2b(self._normalize_url(url).encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'little')
+
     def _make_request(
         self,
         url: str,
@@ -466,7 +702,7 @@ class DumbCrawlerSpider(scrapy.Spider):
         **kwargs
     ) -> Request:
         """Create a request with appropriate meta data."""
-        use_playwright = self._should_use_playwright(url)
+        use_playwright = self._use_playwright
         meta = {
             "depth": depth,
             "referrer": referrer,
@@ -474,33 +710,18 @@ class DumbCrawlerSpider(scrapy.Spider):
         }
 
         # Add Playwright page methods for screenshot and performance timing
-        if use_playwright and self._screenshot_enabled and self._screenshot_dir:
+        if use_playwright and self._screenshot_enabled and self._screenshot_prefix:
             # Generate screenshot filename from URL hash
-            url_hash = hashlib.md5(url.encode('utf-8')).hexdigest()[:12]
-            screenshot_path = os.path.join(self._screenshot_dir, f"{url_hash}.png")
+            url_hash = hashlib.blake2b(url.encode('utf-8'), digest_size=6).hexdigest()
+            screenshot_path = self._screenshot_prefix + url_hash + ".png"
 
             meta["playwright_page_methods"] = [
                 # Capture screenshot (full page)
                 PageMethod("screenshot", path=screenshot_path, full_page=True),
                 # Capture performance timing via JavaScript
-                PageMethod(
-                    "evaluate",
-                    """() => {
-                        const timing = performance.timing;
-                        const navigation = performance.getEntriesByType('navigation')[0] || {};
-                        return {
-                            dns_lookup_ms: timing.domainLookupEnd - timing.domainLookupStart,
-                            tcp_connect_ms: timing.connectEnd - timing.connectStart,
-                            ttfb_ms: timing.responseStart - timing.requestStart,
-                            dom_load_ms: timing.domContentLoadedEventEnd - timing.navigationStart,
-                            full_load_ms: timing.loadEventEnd - timing.navigationStart,
-                            dom_interactive_ms: timing.domInteractive - timing.navigationStart,
-                            transfer_size: navigation.transferSize || 0,
-                            encoded_body_size: navigation.encodedBodySize || 0,
-                            decoded_body_size: navigation.decodedBodySize || 0,
-                        };
-                    }"""
-                ),
+                # (a fresh PageMethod per request: scrapy-playwright stores
+                # the evaluate result on it, read back in _extract_page_data)
+                PageMethod("evaluate", PERF_TIMING_JS),
             ]
             meta["_screenshot_path"] = screenshot_path
 
@@ -512,24 +733,6 @@ class DumbCrawlerSpider(scrapy.Spider):
             **kwargs
         )
 
-    def _should_use_playwright(self, url: str) -> bool:
-        """
-        Determine if Playwright should be used for this request.
-
-        JS Modes:
-        - off: Never use Playwright (fastest, for static HTML sites)
-        - full: Always use Playwright (slowest, for JS-heavy sites)
-        - auto: Use Playwright for initial requests, detect if needed for others
-        """
-        if self.js_mode == "full":
-            return True
-        elif self.js_mode == "off":
-            return False
-        else:  # auto mode
-            # In auto mode, use Playwright by default for initial requests
-            # This ensures we get JS-rendered content on first load
-            return True
-
     def _detect_js_requirement(self, response: Response) -> bool:
         """
         Detect if a page requires JavaScript rendering.
@@ -572,10 +775,9 @@ class DumbCrawlerSpider(scrapy.Spider):
 
     def _is_text_response(self, response: Response) -> bool:
         """Check if response contains text content (HTML, XML, etc.)."""
-        # Check content-type header
-        content_type = response.headers.get(b'Content-Type', b'').decode('utf-8', errors='ignore').lower()
-        text_types = ['text/', 'application/xhtml', 'application/xml', 'application/json']
-        return any(t in content_type for t in text_types)
+        # Check content-type header (as bytes, no decoding)
+        content_type = (response.headers.get(b'Content-Type') or b'').lower()
+        return any(t in content_type for t in TEXT_CONTENT_TYPES)
 
     def parse(self, response: Response) -> Generator:
         """Main parse method - extract data and discover links."""
@@ -583,7 +785,7 @@ class DumbCrawlerSpider(scrapy.Spider):
         referrer = response.meta.get("referrer")
 
         # Mark URL as visited (normalized for consistent deduplication)
-        self._visited_urls.add(self._normalize_url(response.url))
+        self._visited_urls.add(self._visited_key(response.url))
 
         # Skip non-text responses (images, PDFs, etc.) - don't save them
         if not self._is_text_response(response):
@@ -610,9 +812,7 @@ class DumbCrawlerSpider(scrapy.Spider):
                 raw_html = ""
 
         # Extract metadata
-        title = self._extract_title(response)
-        meta_description = self._extract_meta_description(response)
-        h1 = self._extract_h1(response)
+        metadata = self._extract_metadata(response)
 
         # Extract headers
         request_headers = self._extract_request_headers(response)
@@ -640,11 +840,7 @@ class DumbCrawlerSpider(scrapy.Spider):
             "depth": depth,
             "referrer": referrer,
             "raw_html": raw_html,
-            "metadata": {
-                "title": title,
-                "meta_description": meta_description,
-                "h1": h1,
-            },
+            "metadata": metadata,
             "request_headers": request_headers,
             "response_headers": response_headers,
             # Performance data
@@ -660,71 +856,61 @@ class DumbCrawlerSpider(scrapy.Spider):
 
     def _extract_request_headers(self, response: Response) -> dict:
         """Extract request headers from the response's request."""
-        headers = {}
-        if hasattr(response, 'request') and response.request:
-            for key, values in response.request.headers.items():
-                # Headers are stored as bytes, decode them
-                key_str = key.decode('utf-8') if isinstance(key, bytes) else key
-                if values:
-                    # Join multiple values with comma (HTTP standard)
-                    val_str = b', '.join(values).decode('utf-8') if isinstance(values[0], bytes) else ', '.join(values)
-                    headers[key_str] = val_str
-        return headers
+        if response.request is None:
+            return {}
+        return self._decode_headers(response.request.headers)
 
     def _extract_response_headers(self, response: Response) -> dict:
         """Extract response headers."""
-        headers = {}
-        for key, values in response.headers.items():
-            # Headers are stored as bytes, decode them
-            key_str = key.decode('utf-8') if isinstance(key, bytes) else key
+        return self._decode_headers(response.headers)
+
+    def _decode_headers(self, headers) -> dict:
+        """Decode Scrapy headers (bytes keys and lists of bytes values) to strings."""
+        decoded = {}
+        for key, values in headers.items():
             if values:
-                # Join multiple values with comma (HTTP standard)
-                val_str = b', '.join(values).decode('utf-8') if isinstance(values[0], bytes) else ', '.join(values)
-                headers[key_str] = val_str
-        return headers
+                # Join multiple values with comma (HTTP standard); most have one
+                value = values[0] if len(values) == 1 else b', '.join(values)
+                decoded[key.decode('utf-8', 'replace')] = value.decode('utf-8', 'replace')
+        return decoded
+
+    def _extract_metadata(self, response: Response) -> Dict[str, Optional[str]]:
+        """Extract title, meta description and first h1 from the response's lxml tree."""
+        metadata = {"title": None, "meta_description": None, "h1": None}
+        try:
+            root = response.selector.root
+        except Exception:
+            return metadata
 
-    def _extract_title(self, response: Response) -> Optional[str]:
-        """Extract page title from response."""
         try:
-            title = response.css("title::text").get()
-            if title:
-                return title.strip()
+            title = TITLE_XPATH(root)
+            if title and title[0]:
+                metadata["title"] = title[0].strip()
         except Exception:
             pass
-        return None
 
-    def _extract_meta_description(self, response: Response) -> Optional[str]:
-        """Extract meta description from response."""
         try:
-            # Try standard meta description
-            description = response.css('meta[name="description"]::attr(content)').get()
-            if description:
-                return description.strip()
-
-            # Try og:description as fallback
-            description = response.css('meta[property="og:description"]::attr(content)').get()
-            if description:
-                return description.strip()
+            # Try standard meta description, then og:description as fallback
+            for xpath in (META_DESCRIPTION_XPATH, OG_DESCRIPTION_XPATH):
+                description = xpath(root)
+                if description and description[0]:
+                    metadata["meta_description"] = description[0].strip()
+                    break
         except Exception:
             pass
-        return None
 
-    def _extract_h1(self, response: Response) -> Optional[str]:
-        """Extract first h1 from response."""
         try:
-            h1 = response.css("h1::text").get()
-            if h1:
-                return h1.strip()
-
-            # Try getting text from h1 with nested elements
-            h1_element = response.css("h1")
-            if h1_element:
-                h1_text = h1_element.css("*::text").getall()
+            h1 = H1_TEXT_XPATH(root)
+            if h1 and h1[0]:
+                metadata["h1"] = h1[0].strip()
+            else:
+                # Try getting text from h1 with nested elements
+                h1_text = H1_ALL_TEXT_XPATH(root)
                 if h1_text:
-                    return " ".join(t.strip() for t in h1_text if t.strip())
+                    metadata["h1"] = " ".join(filter(None, map(str.strip, h1_text)))
         except Exception:
             pass
-        return None
+        return metadata
 
     def _extract_link_locations(self, response: Response) -> Dict[str, Any]:
         """
@@ -734,71 +920,69 @@ class DumbCrawlerSpider(scrapy.Spider):
         Returns dict with counts and sample links per location.
         """
         try:
-            locations = {
-                "nav": {"count": 0, "links": []},
-                "header": {"count": 0, "links": []},
-                "footer": {"count": 0, "links": []},
-                "aside": {"count": 0, "links": []},
-                "main": {"count": 0, "links": []},
-            }
+            locations = _empty_link_locations()
+
+            root = response.selector.root
 
-            # Helper to extract link data
-            def get_link_data(a):
-                href = a.css("::attr(href)").get()
-                text = a.css("::text").get() or ""
-                return {"url": href, "anchor": text.strip()[:100] if text else ""}
+            # One walk over the document's <a href> elements, filing each
+            # under every section it sits in (a <nav> inside a <footer>
+            # counts for both, as with separate per-section selectors)
+            nav_links, header_links, footer_links, aside_links = [], [], [], []
+            main_only_links, article_links, body_links = [], [], []
+            for a in root.iter("a"):
+                if a.get("href") is None:
+                    continue
+                sections = {el.tag for el in a.iterancestors(*LINK_SECTION_TAGS)}
+                if not sections:
+                    continue
+                if "nav" in sections:
+                    nav_links.append(a)
+                elif "header" in sections:
+                    # Header links exclude nav inside header
+                    header_links.append(a)
+                if "footer" in sections:
+                    footer_links.append(a)
+                if "aside" in sections:
+                    aside_links.append(a)
+                if "main" in sections:
+                    main_only_links.append(a)
+                if "article" in sections:
+                    article_links.append(a)
+                if "body" in sections and sections.isdisjoint(NON_MAIN_SECTION_TAGS):
+                    body_links.append(a)
 
             # Nav links - <nav> element
-            nav_links = response.css("nav a[href]")
             for a in nav_links[:50]:  # Limit to first 50 per category
-                locations["nav"]["links"].append(get_link_data(a))
+                locations["nav"]["links"].append(_link_data(a))
             locations["nav"]["count"] = len(nav_links)
 
             # Header links - <header> element (excluding nav inside header)
-            header_links = response.css("header a[href]:not(nav a)")
             for a in header_links[:20]:
-                locations["header"]["links"].append(get_link_data(a))
+                locations["header"]["links"].append(_link_data(a))
             locations["header"]["count"] = len(header_links)
 
             # Footer links - <footer> element
-            footer_links = response.css("footer a[href]")
             for a in footer_links[:30]:
-                locations["footer"]["links"].append(get_link_data(a))
+                locations["footer"]["links"].append(_link_data(a))
             locations["footer"]["count"] = len(footer_links)
 
             # Aside/sidebar links
-            aside_links = response.css("aside a[href]")
             for a in aside_links[:20]:
-                locations["aside"]["links"].append(get_link_data(a))
+                locations["aside"]["links"].append(_link_data(a))
             locations["aside"]["count"] = len(aside_links)
 
             # Main content links - <main>, <article>, or body excluding nav/header/footer/aside
-            # Try main first, then article, then fallback
-            main_links = response.css("main a[href]")
-            if not main_links:
-                main_links = response.css("article a[href]")
-            if not main_links:
-                # Fallback: get all links not in nav/header/footer/aside
-                all_links = response.css("a[href]")
-                # Filter out structural elements (approximate)
-                main_links = response.css(
-                    "body a[href]:not(nav a):not(header a):not(footer a):not(aside a)"
-                )
+            # Try main first, then article, then fallback (approximate)
+            main_links = main_only_links or article_links or body_links
             for a in main_links[:50]:
-                locations["main"]["links"].append(get_link_data(a))
+                locations["main"]["links"].append(_link_data(a))
             locations["main"]["count"] = len(main_links)
 
             return locations
 
         except Exception as e:
             self.logger.debug(f"Error extracting link locations: {e}")
-            return {
-                "nav": {"count": 0, "links": []},
-                "header": {"count": 0, "links": []},
-                "footer": {"count": 0, "links": []},
-                "aside": {"count": 0, "links": []},
-                "main": {"count": 0, "links": []},
-            }
+            return _empty_link_locations()
 
     def _follow_links(self, response: Response, current_depth: int) -> Generator[Request, None, None]:
         """Extract and follow links from the response."""
@@ -810,10 +994,10 @@ class DumbCrawlerSpider(scrapy.Spider):
 
         for link in links:
             url = link.url
-            normalized_url = self._normalize_url(url)
+            visited_key = self._visited_key(url)
 
             # Skip already visited URLs
-            if normalized_url in self._visited_urls:
+            if visited_key in self._visited_urls:
                 continue
 
             # Check if URL is within scope
@@ -821,7 +1005,7 @@ class DumbCrawlerSpider(scrapy.Spider):
                 continue
 
             # Mark as visited to prevent duplicate requests
-            self._visited_urls.add(normalized_url)
+            self._visited_urls.add(visited_key)
 
             yield self._make_request(
                 url=url,
@@ -829,84 +1013,34 @@ class DumbCrawlerSpider(scrapy.Spider):
                 referrer=response.url,
             )
 
-    def _is_url_in_scope(self, url: str) -> bool:
-        """
-        Check if URL is within the configured scope.
-
-        Scope types:
-        - subdomain: URL must have same full netloc (e.g., www.example.com)
-        - domain: URL must have same root domain (e.g., *.example.com)
-        - subfolder: URL must be under same path prefix
-        - subdomain+subfolder: URL must match both subdomain AND subfolder
-        """
-        target_info = self._parse_url_info(url)
-
-        # Check against all base URLs - URL is in scope if it matches ANY base URL
-        for base_info in self._base_urls_info:
-            if self._matches_scope(target_info, base_info):
-                return True
-
-        return False
-
-    def _matches_scope(self, target_info: dict, base_info: dict) -> bool:
-        """Check if target URL matches the scope criteria against a base URL."""
-        if self.scope == "subdomain":
-            # Must match exact netloc (full subdomain)
-            return target_info["netloc"] == base_info["netloc"]
-
-        elif self.scope == "domain":
-            # Must match root domain (allows any subdomain)
-            return target_info["domain"] == base_info["domain"]
-
-        elif self.scope == "subfolder":
-            # Must be under the same path prefix AND same netloc
-            if target_info["netloc"] != base_info["netloc"]:
-                return False
-            return self._is_under_path(target_info["path"], base_info["path"])
+    # URL scope checks, one per scope type; __init__ binds the configured one
+    # as self._is_url_in_scope(url)
 
-        elif self.scope == "subdomain+subfolder":
-            # Must match exact netloc AND be under same path prefix
-            if target_info["netloc"] != base_info["netloc"]:
-                return False
-            return self._is_under_path(target_info["path"], base_info["path"])
+    def _is_url_in_domain_scope(self, url: str) -> bool:
+        """domain scope: URL must have the same root domain (e.g., *.example.com)."""
+        return _split_netloc(_split_url(url)[1])[0] in self._scope_domains
 
-        return False
-
-    def _is_under_path(self, target_path: str, base_path: str) -> bool:
-        """Check if target path is under (or equal to) base path."""
-        # Normalize paths
-        target = target_path.rstrip("/")
-        base = base_path.rstrip("/")
+    def _is_url_in_subdomain_scope(self, url: str) -> bool:
+        """subdomain scope: URL must have the same full netloc (e.g., www.example.com)."""
+        return _split_url(url)[1] in self._scope_netlocs
 
-        # Empty base path means root - everything is under it
-        if not base:
-            return True
-
-        # Target must start with base path
-        if not target.startswith(base):
+    def _is_url_in_subfolder_scope(self, url: str) -> bool:
+        """
+        subfolder and subdomain+subfolder scopes: URL must have the same full
+        netloc and be equal to or under one of that netloc's base paths, on a
+        path boundary (/blog matches /blog/post but not /blogger).
+        """
+        _, netloc, path, _ = _split_url(url)
+        if netloc not in self._scope_netlocs:
             return False
-
-        # Make sure it's a proper path boundary (not just prefix match)
-        # e.g., /blog should match /blog/post but not /blogger
-        if len(target) > len(base):
-            return target[len(base)] == "/"
-
-        return True
+        path = path.rstrip("/")
+        return path in self._scope_paths[netloc] or path.startswith(self._scope_path_prefixes[netloc])
 
     def handle_error(self, failure):
         """Handle request errors and still capture failed responses."""
         request = failure.request
         self.logger.warning(f"Request error for {request.url}: {failure.value}")
 
-        # Default empty structures for error responses
-        empty_link_locations = {
-            "nav": {"count": 0, "links": []},
-            "header": {"count": 0, "links": []},
-            "footer": {"count": 0, "links": []},
-            "aside": {"count": 0, "links": []},
-            "main": {"count": 0, "links": []},
-        }
-
         # Try to extract response if available (e.g., for HTTP errors)
         response = getattr(failure.value, 'response', None)
         if response is not None:
@@ -936,7 +1070,7 @@ class DumbCrawlerSpider(scrapy.Spider):
                     "response_headers": {},
                     "performance": {"download_latency_s": None, "timing": None},
                     "screenshot_path": None,
-                    "link_locations": empty_link_locations,
+                    "link_locations": _empty_link_locations(),
                     "error": str(failure.value),
                 }
         else:
@@ -959,6 +1093,6 @@ class DumbCrawlerSpider(scrapy.Spider):
                 "response_headers": {},
                 "performance": {"download_latency_s": None, "timing": None},
                 "screenshot_path": None,
-                "link_locations": empty_link_locations,
+                "link_locations": _empty_link_locations(),
                 "error": str(failure.value),
             }
@@ -17,6 +17,32 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from crawler.entity_extractor import EntityExtractor, extract_entities
 
+# ijson streams just the fields we need out of a crawl dump instead of
+# materializing the whole page (raw_html, links, ...); optional
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+JSON_FILE_FIELDS = ('url', 'main_content', 'body_text')
+
+
+def load_json_fields(path: str) -> dict:
+    """Read the url/main_content/body_text fields from a crawl output JSON file."""
+    if ijson is None:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return {key: data.get(key) for key in JSON_FILE_FIELDS}
+
+    fields = {}
+    with open(path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix in JSON_FILE_FIELDS and event == 'string':
+                fields[prefix] = value
+                if len(fields) == len(JSON_FILE_FIELDS):
+                    break
+    return fields
+
 
 def print_entities_table(entities: list, title: str = "Extracted Entities"):
     """Print entities in a formatted table."""
@@ -100,8 +126,7 @@ def main():
         if not os.path.exists(args.json_file):
             print(f"Error: JSON file not found: {args.json_file}")
             sys.exit(1)
-        with open(args.json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_fields(args.json_file)
 
         # Prefer main_content (excludes nav/header/footer) over body_text
         content = data.get('main_content') or data.get('body_text', '')
@@ -110,7 +135,7 @@ def main():
         if not content:
             print("Error: No content found in JSON file")
             sys.exit(1)
-        print(f"Loaded content from: {data.get('url', args.json_file)}")
+        print(f"Loaded content from: {data.get('url') or args.json_file}")
         print(f"Content source: {content_source}")
         print(f"Word count: {len(content.split())}")
 
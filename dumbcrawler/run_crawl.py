@@ -24,6 +24,7 @@ def run_dumb_crawl(
     js_mode: str = "auto",
     restrict_to_subdomain: bool = True,
     restrict_to_path: bool = False,
+    http_cache: bool = False,
 ) -> None:
     """
     Run DumbSpider with the specified configuration.
@@ -37,12 +38,19 @@ def run_dumb_crawl(
         js_mode: JavaScript mode - 'off', 'auto', or 'full'
         restrict_to_subdomain: Only crawl same subdomain
         restrict_to_path: Only crawl same path prefix
+        http_cache: Serve repeat fetches from Scrapy's on-disk HTTP cache
     """
     # Change to scrapy_app directory for settings
     os.chdir(os.path.join(os.path.dirname(__file__), "scrapy_app"))
 
     # Get Scrapy settings
     settings = get_project_settings()
+    if js_mode == "off":
+        # No request opts into Playwright, so use Scrapy's own HTTP handlers
+        # and skip launching the browser and its startup context
+        settings.set("DOWNLOAD_HANDLERS", {})
+    if http_cache:
+        settings.set("HTTPCACHE_ENABLED", True)
 
     # Create and configure crawler process
     process = CrawlerProcess(settings)
@@ -150,6 +158,13 @@ Examples:
         help="Only crawl same path prefix (default: False)"
     )
 
+    parser.add_argument(
+        "--http-cache",
+        action="store_true",
+        default=False,
+        help="Cache responses on disk and reuse them on re-crawls (default: False)"
+    )
+
     return parser.parse_args()
 
 
@@ -171,6 +186,7 @@ if __name__ == "__main__":
     print(f"  js_mode:               {args.js_mode}")
     print(f"  restrict_to_subdomain: {args.restrict_to_subdomain}")
     print(f"  restrict_to_path:      {args.restrict_to_path}")
+    print(f"  http_cache:            {args.http_cache}")
     print("=" * 60)
 
     run_dumb_crawl(
@@ -182,6 +198,7 @@ if __name__ == "__main__":
         js_mode=args.js_mode,
         restrict_to_subdomain=args.restrict_to_subdomain,
         restrict_to_path=args.restrict_to_path,
+        http_cache=args.http_cache,
     )
 
     print("=" * 60)
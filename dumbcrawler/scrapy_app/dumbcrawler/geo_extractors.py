@@ -3,17 +3,93 @@ GEO (Generative Engine Optimization) Extractors.
 Each extractor class has a static extract() method returning a dictionary.
 """
 import re
+import time
+from array import array
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Any, Optional, Tuple, Union
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlparse, urljoin
 from urllib.request import Request, urlopen
 
 import textstat
 from bs4 import BeautifulSoup, Tag
+from lxml import etree
+from lxml import html as lxml_html
 
 from . import geo_patterns
 
+SECONDS_PER_DAY = 86400
+
+# Text nodes as bs4's get_text() sees them: comments and
+# script/style/template bodies are not text content
+_TEXT_NODES = etree.XPath(
+    'descendant-or-self::text()'
+    '[not(ancestor::script or ancestor::style or ancestor::template)]',
+    smart_strings=False,
+)
+
+
+def findall_in_runs(pattern: re.Pattern, run_pattern: re.Pattern,
+                    keyword_pattern: re.Pattern, text: str) -> list:
+    """
+    Same result as pattern.findall(text) for the [\\w\\s]+ GEO patterns, whose
+    matches never cross characters outside run_pattern and always contain
+    keyword_pattern. Each run is searched separately, which bounds their
+    backtracking to the run, and runs without a keyword are skipped with a
+    linear search instead of a backtracking one.
+    """
+    matches = []
+    for run in run_pattern.findall(text):
+        if keyword_pattern.search(run):
+            matches.extend(pattern.findall(run))
+    return matches
+
+
+# Nothing looks elements up by id, so skip building the id index per parse.
+# Comments are kept: they separate text nodes that bs4 treats as distinct strings.
+HTML_TREE_PARSER = lxml_html.HTMLParser(collect_ids=False)
+
+
+def parse_html_tree(raw_html: str) -> lxml_html.HtmlElement:
+    """
+    Parse raw HTML into an lxml tree for the attribute-heavy extractors.
+
+    Args:
+        raw_html: Raw HTML string
+
+    Returns:
+        Root <html> element
+    """
+    try:
+        return lxml_html.document_fromstring(raw_html, parser=HTML_TREE_PARSER)
+    except ValueError:
+        # lxml rejects str input that carries an XML encoding declaration
+        return lxml_html.document_fromstring(raw_html.encode('utf-8'), parser=HTML_TREE_PARSER)
+
+
+def utf8_len(text: Union[str, bytes]) -> int:
+    """
+    Size of text in UTF-8 bytes, without encoding a copy when avoidable.
+
+    Args:
+        text: Text, or bytes already encoded
+
+    Returns:
+        Byte length
+    """
+    if isinstance(text, (bytes, bytearray)):
+        return len(text)
+    # ASCII-only pages (the common case) are one byte per character
+    return len(text) if text.isascii() else len(text.encode('utf-8'))
+
+
+def element_text(element: lxml_html.HtmlElement, separator: str = '', strip: bool = False) -> str:
+    """lxml equivalent of bs4's Tag.get_text(separator, strip)."""
+    if strip:
+        return separator.join(filter(None, (s.strip() for s in _TEXT_NODES(element))))
+    return separator.join(_TEXT_NODES(element))
+
 
 class ReadabilityExtractor:
     """Extract readability metrics using textstat library."""
@@ -128,12 +204,18 @@ class ContentPatternsExtractor:
                         result['question_headings_examples'].append(heading_text)
 
         # Definitions
-        definitions = geo_patterns.DEFINITION_PATTERN.findall(text)
+        definitions = findall_in_runs(
+            geo_patterns.DEFINITION_PATTERN, geo_patterns.DEFINITION_RUN_PATTERN,
+            geo_patterns.DEFINITION_KEYWORD_PATTERN, text,
+        )
         result['definitions_count'] = len(definitions)
         result['definitions_examples'] = [d[:100] for d in definitions[:5]]
 
         # Comparisons
-        comparisons = geo_patterns.COMPARISON_PATTERN.findall(text)
+        comparisons = findall_in_runs(
+            geo_patterns.COMPARISON_PATTERN, geo_patterns.COMPARISON_RUN_PATTERN,
+            geo_patterns.COMPARISON_KEYWORD_PATTERN, text,
+        )
         result['comparisons_count'] = len(comparisons)
 
         # Statistics
@@ -151,7 +233,10 @@ class ContentPatternsExtractor:
         result['expert_mentions_count'] = len(experts)
 
         # Semantic triples
-        triples = geo_patterns.SEMANTIC_TRIPLE_PATTERN.findall(text)
+        triples = findall_in_runs(
+            geo_patterns.SEMANTIC_TRIPLE_PATTERN, geo_patterns.SEMANTIC_TRIPLE_RUN_PATTERN,
+            geo_patterns.SEMANTIC_TRIPLE_KEYWORD_PATTERN, text,
+        )
         result['semantic_triples_count'] = len(triples)
         # Format triples as strings
         result['semantic_triples_examples'] = [
@@ -664,16 +749,18 @@ class LinkAnalysisExtractor:
         """Check if domain is in authority list."""
         domain_lower = domain.lower()
 
-        # Check exact matches
-        for auth_domain in geo_patterns.AUTHORITY_DOMAINS:
-            if auth_domain.startswith('.'):
-                # TLD check (e.g., .gov, .edu)
-                if domain_lower.endswith(auth_domain):
-                    return True
-            else:
-                # Domain check
-                if domain_lower == auth_domain or domain_lower.endswith('.' + auth_domain):
-                    return True
+        # Exact domain match
+        if domain_lower in geo_patterns.AUTHORITY_HOSTS:
+            return True
+
+        # Look up each suffix starting at a dot: as a TLD (e.g., .gov, .edu)
+        # and, without the dot, as a parent authority domain
+        dot = domain_lower.find('.')
+        while dot >= 0:
+            if (domain_lower[dot:] in geo_patterns.AUTHORITY_SUFFIXES
+                    or domain_lower[dot + 1:] in geo_patterns.AUTHORITY_HOSTS):
+                return True
+            dot = domain_lower.find('.', dot + 1)
 
         return False
 
@@ -876,36 +963,46 @@ class TemporalExtractor:
         outdated = geo_patterns.OUTDATED_SIGNAL_PATTERN.findall(text)
         result['outdated_signals_count'] = len(outdated)
 
+        # Age calculations share one clock read (epoch seconds)
+        now_ts = time.time()
+
         # Content age calculation (days since published)
         if published_date:
-            result['content_age_days'] = TemporalExtractor._calculate_age_days(published_date)
+            result['content_age_days'] = TemporalExtractor._calculate_age_days(
+                published_date, now_ts=now_ts
+            )
 
         # Last update age calculation (days since modified)
         if modified_date:
-            result['last_update_age_days'] = TemporalExtractor._calculate_age_days(modified_date)
+            result['last_update_age_days'] = TemporalExtractor._calculate_age_days(
+                modified_date, now_ts=now_ts
+            )
 
         # HTTP Last-Modified age calculation
         if http_last_modified:
             result['http_last_modified_age_days'] = TemporalExtractor._calculate_age_days(
-                http_last_modified, http_format=True
+                http_last_modified, http_format=True, now_ts=now_ts
             )
 
         return result
 
     @staticmethod
-    def _calculate_age_days(date_str: str, http_format: bool = False) -> Optional[int]:
+    def _calculate_age_days(
+        date_str: str,
+        http_format: bool = False,
+        now_ts: Optional[float] = None
+    ) -> Optional[int]:
         """
         Calculate age in days from a date string.
 
         Args:
             date_str: Date string (ISO format or HTTP format)
             http_format: If True, parse as HTTP Last-Modified format
+            now_ts: Current Unix time in seconds (defaults to time.time())
 
         Returns:
             Age in days or None if parsing fails
         """
-        from email.utils import parsedate_to_datetime
-
         try:
             if http_format:
                 # HTTP Last-Modified format: "Wed, 21 Oct 2015 07:28:00 GMT"
@@ -916,24 +1013,33 @@ class TemporalExtractor:
                     date_str.replace('Z', '+00:00')
                 )
 
-            # Calculate age
-            now = datetime.now(parsed_date.tzinfo) if parsed_date.tzinfo else datetime.now()
-            age = now - parsed_date
-            return max(0, age.days)  # Ensure non-negative
-        except (ValueError, TypeError, AttributeError):
+            # Integer epoch diff instead of building a timedelta
+            # (naive datetimes are interpreted as local time, like datetime.now())
+            if now_ts is None:
+                now_ts = time.time()
+            age_days = int((now_ts - parsed_date.timestamp()) // SECONDS_PER_DAY)
+            return max(0, age_days)  # Ensure non-negative
+        except (ValueError, TypeError, AttributeError, OverflowError, OSError):
             return None
 
 
 class MultimediaExtractor:
     """Extract multimedia elements from HTML."""
 
+    # Per-category caps bound worst-case time on spammy pages
+    # (e.g. thousands of PDF links); counts report the capped list sizes
+    MAX_VIDEOS = 100
+    MAX_AUDIO = 100
+    MAX_PDFS = 500
+    MAX_INFOGRAPHICS = 200
+
     @staticmethod
-    def extract(soup: BeautifulSoup) -> Dict[str, Any]:
+    def extract(tree: lxml_html.HtmlElement) -> Dict[str, Any]:
         """
         Extract multimedia elements.
 
         Args:
-            soup: BeautifulSoup object
+            tree: lxml root element (see parse_html_tree)
 
         Returns:
             Dictionary with multimedia analysis
@@ -956,8 +1062,10 @@ class MultimediaExtractor:
         videos = []
 
         # YouTube, Vimeo, Wistia iframes
-        for iframe in soup.find_all('iframe'):
-            src = iframe.get('src', '') or iframe.get('data-src', '')
+        for iframe in tree.iter('iframe'):
+            if len(videos) >= MultimediaExtractor.MAX_VIDEOS:
+                break
+            src = iframe.get('src') or iframe.get('data-src') or ''
             if any(domain in src.lower() for domain in
                    ['youtube.com', 'youtu.be', 'vimeo.com', 'wistia.com', 'wistia.net']):
                 videos.append({
@@ -967,10 +1075,12 @@ class MultimediaExtractor:
                 })
 
         # HTML5 video tags
-        for video in soup.find_all('video'):
+        for video in tree.iter('video'):
+            if len(videos) >= MultimediaExtractor.MAX_VIDEOS:
+                break
             src = video.get('src', '')
-            source = video.find('source')
-            if source:
+            source = video.find('.//source')
+            if source is not None:
                 src = source.get('src', src)
             if src:
                 videos.append({
@@ -987,10 +1097,12 @@ class MultimediaExtractor:
         audio = []
 
         # HTML5 audio
-        for audio_tag in soup.find_all('audio'):
+        for audio_tag in tree.iter('audio'):
+            if len(audio) >= MultimediaExtractor.MAX_AUDIO:
+                break
             src = audio_tag.get('src', '')
-            source = audio_tag.find('source')
-            if source:
+            source = audio_tag.find('.//source')
+            if source is not None:
                 src = source.get('src', src)
             if src:
                 audio.append({
@@ -1000,8 +1112,10 @@ class MultimediaExtractor:
                 })
 
         # Podcast iframes (Spotify, Apple, Anchor)
-        for iframe in soup.find_all('iframe'):
-            src = iframe.get('src', '') or iframe.get('data-src', '')
+        for iframe in tree.iter('iframe'):
+            if len(audio) >= MultimediaExtractor.MAX_AUDIO:
+                break
+            src = iframe.get('src') or iframe.get('data-src') or ''
             if any(domain in src.lower() for domain in
                    ['spotify.com', 'podcasts.apple.com', 'anchor.fm', 'soundcloud.com']):
                 audio.append({
@@ -1016,13 +1130,16 @@ class MultimediaExtractor:
 
         # PDFs
         pdfs = []
-        for link in soup.find_all('a', href=True):
-            href = link.get('href', '')
-            if href.lower().endswith('.pdf'):
+        for link in tree.iter('a'):
+            href = link.get('href')
+            # Lowercase only the 4-char suffix, not the whole URL
+            if href and href[-4:].lower() == '.pdf':
                 pdfs.append({
                     'url': href[:500],
-                    'anchor_text': link.get_text(strip=True)[:100],
+                    'anchor_text': element_text(link, strip=True)[:100],
                 })
+                if len(pdfs) >= MultimediaExtractor.MAX_PDFS:
+                    break
 
         result['pdfs'] = pdfs
         result['pdf_count'] = len(pdfs)
@@ -1030,17 +1147,19 @@ class MultimediaExtractor:
 
         # Infographics
         infographics = []
-        infographic_keywords = ['infographic', 'chart', 'diagram', 'graph', 'visualization']
 
-        for img in soup.find_all('img'):
-            alt = img.get('alt', '').lower()
-            src = (img.get('src', '') or img.get('data-src', '')).lower()
+        for img in tree.iter('img'):
+            alt = img.get('alt', '')
+            src = img.get('src') or img.get('data-src') or ''
 
-            if any(kw in alt or kw in src for kw in infographic_keywords):
+            # One case-insensitive alternation scan instead of 5 keywords x 2 strings
+            if geo_patterns.INFOGRAPHIC_PATTERN.search(alt + ' ' + src):
                 infographics.append({
                     'src': img.get('src', img.get('data-src', ''))[:500],
                     'alt': img.get('alt', '')[:200],
                 })
+                if len(infographics) >= MultimediaExtractor.MAX_INFOGRAPHICS:
+                    break
 
         result['infographics'] = infographics
         result['infographic_count'] = len(infographics)
@@ -1078,12 +1197,12 @@ class AICrawlabilityExtractor:
     """Analyze AI crawler accessibility."""
 
     @staticmethod
-    def extract(soup: BeautifulSoup, raw_html: str) -> Dict[str, Any]:
+    def extract(tree: lxml_html.HtmlElement, raw_html: str) -> Dict[str, Any]:
         """
         Analyze AI crawler accessibility.
 
         Args:
-            soup: BeautifulSoup object
+            tree: lxml root element (see parse_html_tree)
             raw_html: Raw HTML string
 
         Returns:
@@ -1107,48 +1226,52 @@ class AICrawlabilityExtractor:
         }
 
         # HTML and text sizes
-        html_size = len(raw_html.encode('utf-8')) if raw_html else 0
-        text = soup.get_text()
-        text_size = len(text.encode('utf-8')) if text else 0
+        html_size = utf8_len(raw_html) if raw_html else 0
+        # Count per text node rather than joining the whole page text first
+        text_size = sum(len(s.encode('utf-8')) for s in _TEXT_NODES(tree))
 
         result['html_size_bytes'] = html_size
         result['text_size_bytes'] = text_size
         result['content_ratio'] = round(text_size / html_size, 3) if html_size > 0 else 0
 
         # Script analysis
-        scripts = soup.find_all('script')
         inline_count = 0
         external_count = 0
+        total_count = 0
+        frameworks = []
 
-        for script in scripts:
-            if script.get('src'):
+        for script in tree.iter('script'):
+            total_count += 1
+            src = script.get('src')
+            if src:
                 external_count += 1
-            elif script.string:
+
+                # Check script sources for frameworks
+                for needle in geo_patterns.JS_FRAMEWORK_SRC_PATTERN.findall(src):
+                    frameworks.append(geo_patterns.JS_FRAMEWORK_SRC_NAMES[needle.lower()])
+            elif script.text:
                 inline_count += 1
 
         result['inline_scripts_count'] = inline_count
         result['external_scripts_count'] = external_count
-        result['total_scripts_count'] = len(scripts)
+        result['total_scripts_count'] = total_count
 
         # Noscript content
-        noscript_tags = soup.find_all('noscript')
         result['has_noscript_content'] = any(
-            ns.get_text(strip=True) for ns in noscript_tags
+            element_text(ns, strip=True) for ns in tree.iter('noscript')
         )
 
         # Meta robots
-        meta_robots = soup.find('meta', attrs={'name': re.compile(r'^robots$', re.I)})
-        if meta_robots:
-            result['meta_robots'] = meta_robots.get('content', '')
-
-        # Iframes
-        result['iframe_count'] = len(soup.find_all('iframe'))
+        for meta in tree.iter('meta'):
+            if (meta.get('name') or '').lower() == 'robots':
+                result['meta_robots'] = meta.get('content', '')
+                break
 
         # Lazy loading images
         lazy_images = 0
         data_src_images = 0
 
-        for img in soup.find_all('img'):
+        for img in tree.iter('img'):
             if img.get('loading') == 'lazy':
                 lazy_images += 1
             if img.get('data-src') and not img.get('src'):
@@ -1157,49 +1280,103 @@ class AICrawlabilityExtractor:
         result['lazy_images_count'] = lazy_images
         result['data_src_images_count'] = data_src_images
 
-        # Custom elements (tags with hyphens)
+        # Element census: iframes, canvas, custom elements (tags with hyphens)
+        # and framework-specific attributes, in a single walk
+        iframe_count = 0
+        canvas_count = 0
         custom_elements = 0
-        for tag in soup.find_all():
-            if '-' in tag.name:
+        attr_frameworks = {}  # insertion-ordered set
+
+        for element in tree.iter(etree.Element):
+            tag = element.tag
+            if tag == 'iframe':
+                iframe_count += 1
+            elif tag == 'canvas':
+                canvas_count += 1
+            elif '-' in tag:
                 custom_elements += 1
 
+            attrib = element.attrib
+            if attrib:
+                if 'ng-app' in attrib or 'ng-controller' in attrib:
+                    attr_frameworks['angular'] = None
+                if 'data-reactroot' in attrib or 'data-reactid' in attrib:
+                    attr_frameworks['react'] = None
+                if 'data-v-' in attrib or 'v-bind' in attrib:
+                    attr_frameworks['vue'] = None
+                if 'data-ember-action' in attrib:
+                    attr_frameworks['ember'] = None
+
+        result['iframe_count'] = iframe_count
+        result['canvas_elements_count'] = canvas_count
         result['custom_elements_count'] = custom_elements
 
-        # Canvas elements
-        result['canvas_elements_count'] = len(soup.find_all('canvas'))
-
         # JS framework detection
-        frameworks = []
-
-        # Check for framework-specific attributes and patterns
-        if soup.find(attrs={'ng-app': True}) or soup.find(attrs={'ng-controller': True}):
-            frameworks.append('angular')
-
-        if soup.find(attrs={'data-reactroot': True}) or soup.find(attrs={'data-reactid': True}):
-            frameworks.append('react')
-
-        if soup.find(attrs={'data-v-': re.compile(r'.*')}) or soup.find(attrs={'v-bind': True}):
-            frameworks.append('vue')
-
-        if soup.find(attrs={'data-ember-action': True}):
-            frameworks.append('ember')
-
-        # Check script sources for frameworks
-        for script in soup.find_all('script', src=True):
-            src = script.get('src', '').lower()
-            if 'react' in src:
-                frameworks.append('react')
-            if 'angular' in src:
-                frameworks.append('angular')
-            if 'vue' in src:
-                frameworks.append('vue')
-            if 'jquery' in src:
-                frameworks.append('jquery')
-            if 'next' in src:
-                frameworks.append('nextjs')
-            if 'nuxt' in src:
-                frameworks.append('nuxt')
-
-        result['js_framework_signals'] = list(set(frameworks))
+        frameworks.extend(attr_frameworks)
+        # Ordered dedup keeps output deterministic across runs
+        result['js_framework_signals'] = list(dict.fromkeys(frameworks))
 
         return result
+
+
+class CrawlabilityCounters:
+    """
+    Columnar store of AICrawlabilityExtractor counters across many pages.
+
+    Each counter is kept in its own typed array (struct-of-arrays), so crawl-level
+    aggregation walks contiguous machine values instead of per-page result dicts.
+    """
+
+    # field -> array typecode ('q' = int64, 'd' = float64)
+    FIELDS = {
+        'html_size_bytes': 'q',
+        'text_size_bytes': 'q',
+        'content_ratio': 'd',
+        'iframe_count': 'q',
+        'inline_scripts_count': 'q',
+        'external_scripts_count': 'q',
+        'total_scripts_count': 'q',
+        'lazy_images_count': 'q',
+        'data_src_images_count': 'q',
+        'custom_elements_count': 'q',
+        'canvas_elements_count': 'q',
+    }
+
+    def __init__(self):
+        self.columns = {field: array(code) for field, code in self.FIELDS.items()}
+
+    def __len__(self) -> int:
+        return len(self.columns['html_size_bytes'])
+
+    def append(self, result: Dict[str, Any]) -> None:
+        """
+        Add one page's counters.
+
+        Args:
+            result: Dictionary returned by AICrawlabilityExtractor.extract()
+        """
+        if not result or 'error' in result:
+            return
+        for field, column in self.columns.items():
+            column.append(result.get(field) or 0)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Aggregate each counter over all pages added so far.
+
+        Returns:
+            Dictionary of field -> {'mean', 'p95', 'max'}
+        """
+        count = len(self)
+        if not count:
+            return {}
+        p95_index = min(count - 1, int(count * 0.95))
+        summary = {}
+        for field, column in self.columns.items():
+            ordered = sorted(column)
+            summary[field] = {
+                'mean': round(sum(column) / count, 3),
+                'p95': ordered[p95_index],
+                'max': ordered[-1],
+            }
+        return summary
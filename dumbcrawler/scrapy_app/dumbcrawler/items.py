@@ -29,6 +29,8 @@ class DumbcrawlerItem(scrapy.Item):
     # RAW CONTENT
     # =========================================================================
     raw_html = scrapy.Field()
+    raw_html_sha256 = scrapy.Field()  # str, replaces raw_html when DROP_RAW_HTML
+    raw_html_path = scrapy.Field()  # str, gzipped HTML when RAW_HTML_BLOB_DIR is set
     page_size_bytes = scrapy.Field()  # int
 
     # =========================================================================
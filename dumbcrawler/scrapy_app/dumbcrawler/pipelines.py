@@ -1,14 +1,35 @@
 """
 Pipelines for dumbcrawler.
 """
+import asyncio
+import gzip
+import hashlib
 import json
+import os
+import queue
 import re
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
-import html2text
 from bs4 import BeautifulSoup
+from bs4.builder import LXMLTreeBuilder
+from lxml import etree
+
+# orjson serializes output items several times faster; optional.
+# json_line returns one UTF-8 encoded JSON Lines record.
+try:
+    import orjson
+
+    def json_line(obj):
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    orjson = None
+
+    def json_line(obj):
+        return (json.dumps(obj, ensure_ascii=False, default=str) + "\n").encode("utf-8")
 
 from .geo_extractors import (
     ReadabilityExtractor,
@@ -23,23 +44,275 @@ from .geo_extractors import (
     TemporalExtractor,
     MultimediaExtractor,
     AICrawlabilityExtractor,
+    element_text,
+    parse_html_tree,
+    utf8_len,
 )
 
+# One tree builder per thread: skips BeautifulSoup's per-call builder lookup
+# and construction, and is safe when AUDIT_THREADS audits pages in parallel
+_builder_local = threading.local()
+
+
+def html_builder():
+    """The calling thread's shared LXMLTreeBuilder."""
+    builder = getattr(_builder_local, "builder", None)
+    if builder is None:
+        builder = _builder_local.builder = LXMLTreeBuilder()
+    return builder
+
+# Page-level fields are read from the lxml tree with XPaths compiled once;
+# the soup is only kept for the GEO extractors that still take one
+TITLE_XPATH = etree.XPath('(//title)[1]')
+H1_XPATH = etree.XPath('(//h1)[1]')
+H2_XPATH = etree.XPath('//h2')
+H3_XPATH = etree.XPath('//h3')
+META_XPATH = etree.XPath('//meta')
+LINK_XPATH = etree.XPath('//link[@rel]')
+IMAGES_XPATH = etree.XPath('//img')
+LINKS_XPATH = etree.XPath('//a[@href]')
+
+ROBOTS_NAME_PATTERN = re.compile(r"^robots$", re.I)
+CHARSET_PATTERN = re.compile(r"charset=([^\s;]+)", re.I)
+
+# Left out of the body text: subtrees of these tags, and of tags with these
+# class names. <template> contents are never text (as with bs4's get_text).
+BODY_SKIP_TAGS = frozenset({
+    "script", "style", "nav", "header", "footer",
+    "aside", "noscript", "iframe", "svg", "template",
+})
+BODY_SKIP_CLASSES = frozenset({
+    "nav", "navigation", "menu", "sidebar",
+    "footer", "header", "advertisement", "ads",
+})
+
+# Markdown rendering: skipped subtrees, tags that start a new block, heading
+# prefixes and inline emphasis marks
+MARKDOWN_SKIP_TAGS = frozenset({"head", "script", "style", "template", "svg"})
+MARKDOWN_BLOCK_TAGS = frozenset({
+    "p", "div", "section", "article", "main", "header", "footer", "nav",
+    "aside", "figure", "figcaption", "form", "fieldset", "address",
+    "details", "summary", "dl", "dt", "dd", "center",
+})
+MARKDOWN_HEADINGS = {f"h{level}": "#" * level + " " for level in range(1, 7)}
+MARKDOWN_EMPHASIS = {"strong": "**", "b": "**", "em": "_", "i": "_", "code": "`"}
+MARKDOWN_SPACE_PATTERN = re.compile(r"\s+")
+
+
+class MarkdownWriter:
+    """
+    Render an lxml tree as Markdown in one iterwalk pass.
+
+    Covers what html2text produced for crawled pages (links and images kept,
+    no wrapping): headings, paragraphs, links, images, emphasis, lists,
+    blockquotes, preformatted text, rules and tables.
+    """
+
+    def __init__(self):
+        self.blocks = []  # (text, tight): tight blocks go on the next line
+        self.line = []  # inline fragments of the block being built
+        self.prefix = ""  # heading or list item marker for the next block
+        self.quote_depth = 0
+        self.lists = []  # [ordered, items so far] per open list
+        self.links = []  # href, or None for plain-text links, per open <a>
+        self.row = None  # [cells so far, has header cells] for the open <tr>
+        self.tight_depth = 0  # open lists and tables
+        self.loose_next = False  # first block of a list/table follows a blank line
+
+    def render(self, root):
+        """Markdown for root's content."""
+        walker = etree.iterwalk(root, events=("start", "end", "comment", "pi"))
+        for event, elem in walker:
+            if event == "start":
+                if self._start(elem):
+                    walker.skip_subtree()
+                continue
+            if event == "end":
+                self._end(elem)
+            if elem is not root and elem.tail:
+                self._add_text(elem.tail)
+        self._flush()
+
+        out = []
+        for text, tight in self.blocks:
+            if out:
+                out.append("\n" if tight else "\n\n")
+            out.append(text)
+        return "".join(out) + "\n" if out else ""
+
+    def _start(self, elem):
+        """Handle an opening tag; returns True to skip its subtree."""
+        tag = elem.tag
+        if tag in MARKDOWN_SKIP_TAGS:
+            return True
+        if tag in MARKDOWN_EMPHASIS:
+            self.line.append(MARKDOWN_EMPHASIS[tag])
+        elif tag == "a":
+            href = elem.get("href")
+            if href and not href.startswith("#"):
+                self.line.append("[")
+                self.links.append(href)
+            else:
+                self.links.append(None)
+        elif tag == "img":
+            src = elem.get("src")
+            if src:
+                self.line.append(f"![{elem.get('alt', '')}]({src})")
+        elif tag == "br":
+            self.line.append("\n")
+        elif tag in MARKDOWN_BLOCK_TAGS:
+            self._flush()
+        elif tag in MARKDOWN_HEADINGS:
+            self._flush()
+            self.prefix = MARKDOWN_HEADINGS[tag]
+        elif tag in ("ul", "ol"):
+            self._flush()
+            self._open_tight()
+            self.lists.append([tag == "ol", 0])
+        elif tag == "li":
+            self._flush()
+            if self.lists:
+                current = self.lists[-1]
+                current[1] += 1
+                marker = f"{current[1]}. " if current[0] else "* "
+            else:
+                marker = "* "
+            self.prefix = "  " * max(len(self.lists), 1) + marker
+        elif tag == "blockquote":
+            self._flush()
+            self.quote_depth += 1
+        elif tag == "pre":
+            self._flush()
+            code = "".join(elem.itertext()).strip("\n")
+            if code:
+                self._add_block("\n".join("    " + line for line in code.split("\n")))
+            return True
+        elif tag == "hr":
+            self._flush()
+            self._add_block("* * *")
+        elif tag == "table":
+            self._flush()
+            self._open_tight()
+        elif tag == "tr":
+            self._flush()
+            self.row = [0, False]
+        elif tag in ("td", "th"):
+            if self.row is not None:
+                if self.row[0]:
+                    self.line.append(" | ")
+                self.row[0] += 1
+                self.row[1] = self.row[1] or tag == "th"
+        if elem.text:
+            self._add_text(elem.text)
+        return False
+
+    def _end(self, elem):
+        """Handle a closing tag."""
+        tag = elem.tag
+        if tag in MARKDOWN_EMPHASIS:
+            self.line.append(MARKDOWN_EMPHASIS[tag])
+        elif tag == "a":
+            href = self.links.pop() if self.links else None
+            if href is not None:
+                self.line.append(f"]({href})")
+        elif tag in MARKDOWN_BLOCK_TAGS:
+            self._flush()
+        elif tag in MARKDOWN_HEADINGS or tag == "li":
+            self._flush()
+            self.prefix = ""
+        elif tag in ("ul", "ol"):
+            self._flush()
+            if self.lists:
+                self.lists.pop()
+            self.tight_depth -= 1
+        elif tag == "blockquote":
+            self._flush()
+            self.quote_depth -= 1
+        elif tag == "table":
+            self._flush()
+            self.tight_depth -= 1
+        elif tag == "tr":
+            self._flush()
+            if self.row and self.row[1]:
+                self._add_block("|".join(["---"] * self.row[0]))
+            self.row = None
+
+    def _add_text(self, text):
+        # Source line breaks are spaces; only <br> breaks a line
+        self.line.append(MARKDOWN_SPACE_PATTERN.sub(" ", text))
+
+    def _open_tight(self):
+        """A list or table opens: its blocks go on consecutive lines."""
+        if not self.tight_depth:
+            self.loose_next = True
+        self.tight_depth += 1
+
+    def _flush(self):
+        """End the block being built, collapsing whitespace (<br> kept as a hard break)."""
+        if not self.line:
+            return
+        text = "".join(self.line)
+        self.line = []
+        text = "  \n".join(" ".join(line.split()) for line in text.split("\n")).strip()
+        if text:
+            self._add_block(self.prefix + text)
+            # Later blocks of the same list item are indented under it
+            self.prefix = "  " * (len(self.lists) + 1) if self.prefix and self.lists else ""
+
+    def _add_block(self, text):
+        if self.quote_depth:
+            text = "\n".join("> " * self.quote_depth + line for line in text.split("\n"))
+        self.blocks.append((text, self.tight_depth > 0 and not self.loose_next))
+        self.loose_next = False
+
 
 class GEOAuditPipeline:
     """
     Comprehensive GEO (Generative Engine Optimization) audit pipeline.
     Extracts 60+ data points across 10 categories.
+
+    The audit is CPU-bound (and the broken link check blocks on the network).
+    With AUDIT_THREADS > 0 it runs in a thread pool so the reactor thread
+    keeps serving downloads.
     """
 
-    def __init__(self):
-        self.html2text_handler = html2text.HTML2Text()
-        self.html2text_handler.ignore_links = False
-        self.html2text_handler.ignore_images = False
-        self.html2text_handler.body_width = 0  # No wrapping
+    def __init__(self, drop_raw_html=False, markdown=True, audit_threads=0, blob_dir=None):
+        self.drop_raw_html = drop_raw_html
+        self.blob_dir = Path(blob_dir) if blob_dir else None
+        self._stored_blobs = set()  # sha256s already on disk, to skip the stat
+        self.markdown = markdown
+        self.audit_threads = audit_threads
+        self._executor = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(
+            crawler.settings.getbool("DROP_RAW_HTML", False),
+            crawler.settings.getbool("MARKDOWN_CONTENT_ENABLED", True),
+            crawler.settings.getint("AUDIT_THREADS", 0),
+            crawler.settings.get("RAW_HTML_BLOB_DIR"),
+        )
 
-    def process_item(self, item, spider):
+    def open_spider(self, spider):
+        """Start the audit thread pool if enabled."""
+        if self.audit_threads > 0:
+            self._executor = ThreadPoolExecutor(max_workers=self.audit_threads)
+            spider.logger.info(f"GEO audit using {self.audit_threads} threads")
+
+    def close_spider(self, spider):
+        """Stop the audit thread pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def process_item(self, item, spider):
         """Process item and extract all GEO audit data."""
+        if self._executor is None:
+            return self._audit_item(item, spider)
+        return await asyncio.wrap_future(self._executor.submit(self._audit_item, item, spider))
+
+    def _audit_item(self, item, spider):
+        """Extract all GEO audit data into item (runs on the reactor or a pool thread)."""
         raw_html = item.get("raw_html", "")
         url = item.get("url", "")
 
@@ -47,37 +320,42 @@ class GEOAuditPipeline:
             return item
 
         try:
-            soup = BeautifulSoup(raw_html, "lxml")
+            soup = BeautifulSoup(raw_html, builder=html_builder())
+            tree = parse_html_tree(raw_html)
         except Exception as e:
             spider.logger.warning(f"Failed to parse HTML for {url}: {e}")
             return item
 
         # Set crawled_at timestamp
-        item["crawled_at"] = datetime.utcnow().isoformat() + "Z"
+        item["crawled_at"] = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
         # Calculate page size
-        item["page_size_bytes"] = len(raw_html.encode('utf-8'))
+        item["page_size_bytes"] = utf8_len(raw_html)
+
+        # Index the <meta> tags once for the metadata, SEO and social fields
+        meta = self._harvest_meta(tree)
 
         # Extract basic metadata
-        self._extract_metadata(item, soup)
+        self._extract_metadata(item, tree, meta)
 
         # Extract body text
-        body_text = self._extract_body_text(soup)
+        body_text = self._extract_body_text(tree)
         item["body_content"] = body_text
         item["word_count"] = len(body_text.split()) if body_text else 0
 
         # Generate markdown content
-        try:
-            item["markdown_content"] = self.html2text_handler.handle(raw_html)
-        except Exception as e:
-            spider.logger.warning(f"Markdown conversion failed for {url}: {e}")
-            item["markdown_content"] = None
+        if self.markdown:
+            try:
+                item["markdown_content"] = self._to_markdown(tree)
+            except Exception as e:
+                spider.logger.warning(f"Markdown conversion failed for {url}: {e}")
+                item["markdown_content"] = None
 
         # Extract headings
-        self._extract_headings(item, soup)
+        self._extract_headings(item, tree)
 
         # Extract SEO meta tags
-        self._extract_seo_meta(item, soup)
+        self._extract_seo_meta(item, tree, meta)
 
         # Extract hreflang alternate tags
         try:
@@ -87,13 +365,13 @@ class GEOAuditPipeline:
             item["hreflang"] = {}
 
         # Extract social meta tags
-        self._extract_social_meta(item, soup)
+        self._extract_social_meta(item, meta)
 
         # Extract images
-        self._extract_images(item, soup)
+        self._extract_images(item, tree)
 
         # Extract links
-        self._extract_links(item, soup, url)
+        self._extract_links(item, tree, url)
 
         # Broken link sampling (content decay signal)
         try:
@@ -182,103 +460,184 @@ class GEOAuditPipeline:
             item["temporal_analysis"] = {}
 
         try:
-            item["multimedia"] = MultimediaExtractor.extract(soup)
+            item["multimedia"] = MultimediaExtractor.extract(tree)
         except Exception as e:
             spider.logger.warning(f"Multimedia extraction failed: {e}")
             item["multimedia"] = {}
 
         try:
-            item["ai_crawlability"] = AICrawlabilityExtractor.extract(soup, raw_html)
+            item["ai_crawlability"] = AICrawlabilityExtractor.extract(tree, raw_html)
         except Exception as e:
             spider.logger.warning(f"AI crawlability extraction failed: {e}")
             item["ai_crawlability"] = {}
 
+        if self.drop_raw_html:
+            # Everything downstream needs has been extracted; keep only a
+            # fingerprint (size is in page_size_bytes), plus the path of a
+            # compressed copy when RAW_HTML_BLOB_DIR is set
+            html_bytes = raw_html.encode("utf-8")
+            sha256 = hashlib.sha256(html_bytes).hexdigest()
+            item["raw_html_sha256"] = sha256
+            if self.blob_dir is not None:
+                try:
+                    item["raw_html_path"] = str(self._write_blob(sha256, html_bytes))
+                except OSError as e:
+                    spider.logger.warning(f"Failed to store raw HTML for {url}: {e}")
+            del item["raw_html"]
+
         return item
 
-    def _extract_metadata(self, item, soup):
+    def _write_blob(self, sha256, html_bytes):
+        """
+        Store gzipped HTML content-addressed under blob_dir
+        (ab/cd/<sha256>.html.gz); identical pages share one file.
+        """
+        path = self.blob_dir / sha256[:2] / sha256[2:4] / f"{sha256}.html.gz"
+        if sha256 in self._stored_blobs:
+            return path
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write under a private name and rename, so a concurrent audit
+            # thread never sees a partial blob
+            tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(gzip.compress(html_bytes, compresslevel=6))
+            os.replace(tmp_path, path)
+        self._stored_blobs.add(sha256)
+        return path
+
+    def _harvest_meta(self, tree):
+        """
+        Index the <meta> tags in one pass.
+
+        Returns (by_name, by_property, by_http_equiv, charset): the dicts map a
+        name/property/http-equiv value to the content of the first tag that
+        has it (None if that tag has no content), and charset is the first
+        charset attribute, if any.
+        """
+        by_name, by_property, by_http_equiv = {}, {}, {}
+        charset = None
+        for meta in META_XPATH(tree):
+            content = meta.get("content")
+            name = meta.get("name")
+            if name is not None and name not in by_name:
+                by_name[name] = content
+            prop = meta.get("property")
+            if prop is not None and prop not in by_property:
+                by_property[prop] = content
+            http_equiv = meta.get("http-equiv")
+            if http_equiv is not None and http_equiv not in by_http_equiv:
+                by_http_equiv[http_equiv] = content
+            if charset is None:
+                charset = meta.get("charset")
+        return by_name, by_property, by_http_equiv, charset
+
+    def _extract_metadata(self, item, tree, meta):
         """Extract basic page metadata."""
+        by_name = meta[0]
+
         # Title
-        title_tag = soup.find("title")
-        item["meta_title"] = title_tag.get_text(strip=True) if title_tag else None
+        title_tag = TITLE_XPATH(tree)
+        item["meta_title"] = element_text(title_tag[0], strip=True) if title_tag else None
 
         # Meta description
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        item["meta_description"] = meta_desc.get("content", "").strip() if meta_desc else None
-
-    def _extract_body_text(self, soup):
-        """Extract body text, removing non-content elements."""
-        # Clone soup to avoid modifying original
-        body = soup.find("body")
-        if not body:
-            return ""
-
-        # Create a copy for text extraction
-        body_copy = BeautifulSoup(str(body), "lxml")
+        if "description" in by_name:
+            item["meta_description"] = (by_name["description"] or "").strip()
+        else:
+            item["meta_description"] = None
 
-        # Remove non-content elements
-        for tag in body_copy.find_all([
-            "script", "style", "nav", "header", "footer",
-            "aside", "noscript", "iframe", "svg"
-        ]):
-            tag.decompose()
+    def _extract_body_text(self, tree):
+        """
+        Extract body text, leaving out non-content elements.
 
-        # Also remove common non-content classes
-        for selector in [".nav", ".navigation", ".menu", ".sidebar",
-                         ".footer", ".header", ".advertisement", ".ads"]:
-            for elem in body_copy.select(selector):
-                elem.decompose()
+        One walk over the body that does not enter skipped subtrees, joining
+        stripped text like bs4's get_text(separator=" ", strip=True).
+        """
+        body = tree.find("body")
+        if body is None:
+            return ""
 
-        return body_copy.get_text(separator=" ", strip=True)
+        parts = []
+        walker = etree.iterwalk(body, events=("start", "end", "comment", "pi"))
+        for event, elem in walker:
+            if event == "start":
+                if elem.tag in BODY_SKIP_TAGS or not BODY_SKIP_CLASSES.isdisjoint((elem.get("class") or "").split()):
+                    if elem is body:
+                        return ""
+                    # Its tail is still emitted by the "end" event
+                    walker.skip_subtree()
+                    continue
+                text = elem.text
+            elif elem is body:
+                continue
+            else:
+                # "end", or a comment/PI whose own text is not content
+                text = elem.tail
+            if text:
+                text = text.strip()
+                if text:
+                    parts.append(text)
+
+        return " ".join(parts)
+
+    def _to_markdown(self, tree):
+        """Render the page body as Markdown from the already parsed tree."""
+        body = tree.find("body")
+        if body is None:
+            return ""
+        return MarkdownWriter().render(body)
 
-    def _extract_headings(self, item, soup):
+    def _extract_headings(self, item, tree):
         """Extract heading tags."""
         # First H1
-        h1_tag = soup.find("h1")
-        item["h1"] = h1_tag.get_text(strip=True) if h1_tag else None
+        h1_tag = H1_XPATH(tree)
+        item["h1"] = element_text(h1_tag[0], strip=True) if h1_tag else None
 
         # All H2s
         item["h2_tags"] = [
-            h2.get_text(strip=True) for h2 in soup.find_all("h2")
+            element_text(h2, strip=True) for h2 in H2_XPATH(tree)
         ]
 
         # All H3s
         item["h3_tags"] = [
-            h3.get_text(strip=True) for h3 in soup.find_all("h3")
+            element_text(h3, strip=True) for h3 in H3_XPATH(tree)
         ]
 
-    def _extract_seo_meta(self, item, soup):
+    def _extract_seo_meta(self, item, tree, meta):
         """Extract SEO-related meta tags."""
-        # Canonical URL
-        canonical = soup.find("link", attrs={"rel": "canonical"})
-        item["canonical_url"] = canonical.get("href") if canonical else None
+        by_name, _, by_http_equiv, charset = meta
 
-        # Meta robots
-        robots = soup.find("meta", attrs={"name": re.compile(r"^robots$", re.I)})
-        item["meta_robots"] = robots.get("content") if robots else None
+        # Canonical URL
+        canonical = next(
+            (link for link in LINK_XPATH(tree) if "canonical" in link.get("rel").split()),
+            None,
+        )
+        item["canonical_url"] = canonical.get("href") if canonical is not None else None
+
+        # Meta robots (names are in document order of their first tag)
+        item["meta_robots"] = next(
+            (content for name, content in by_name.items() if ROBOTS_NAME_PATTERN.search(name)),
+            None,
+        )
 
         # Language
-        html_tag = soup.find("html")
-        item["lang_attribute"] = html_tag.get("lang") if html_tag else None
+        item["lang_attribute"] = tree.get("lang")
 
         # Viewport
-        viewport = soup.find("meta", attrs={"name": "viewport"})
-        item["viewport"] = viewport.get("content") if viewport else None
+        item["viewport"] = by_name.get("viewport")
 
         # Charset
-        charset_meta = soup.find("meta", attrs={"charset": True})
-        if charset_meta:
-            item["charset"] = charset_meta.get("charset")
+        if charset is not None:
+            item["charset"] = charset
+        elif "Content-Type" in by_http_equiv:
+            match = CHARSET_PATTERN.search(by_http_equiv["Content-Type"] or "")
+            item["charset"] = match.group(1) if match else None
         else:
-            content_type = soup.find("meta", attrs={"http-equiv": "Content-Type"})
-            if content_type:
-                content = content_type.get("content", "")
-                match = re.search(r"charset=([^\s;]+)", content, re.I)
-                item["charset"] = match.group(1) if match else None
-            else:
-                item["charset"] = None
+            item["charset"] = None
 
-    def _extract_social_meta(self, item, soup):
+    def _extract_social_meta(self, item, meta):
         """Extract Open Graph and Twitter Card meta tags."""
+        by_name, by_property = meta[:2]
+
         # Open Graph
         og_tags = {
             "og_title": "og:title",
@@ -290,8 +649,7 @@ class GEOAuditPipeline:
         }
 
         for field, property_name in og_tags.items():
-            meta = soup.find("meta", attrs={"property": property_name})
-            item[field] = meta.get("content") if meta else None
+            item[field] = by_property.get(property_name)
 
         # Twitter Card
         twitter_tags = {
@@ -303,17 +661,17 @@ class GEOAuditPipeline:
         }
 
         for field, name in twitter_tags.items():
-            meta = soup.find("meta", attrs={"name": name})
-            if not meta:
+            if name in by_name:
+                item[field] = by_name[name]
+            else:
                 # Also try property attribute
-                meta = soup.find("meta", attrs={"property": name})
-            item[field] = meta.get("content") if meta else None
+                item[field] = by_property.get(name)
 
-    def _extract_images(self, item, soup):
+    def _extract_images(self, item, tree):
         """Extract image information."""
         images = []
 
-        for img in soup.find_all("img"):
+        for img in IMAGES_XPATH(tree):
             src = img.get("src") or img.get("data-src")
             if not src:
                 continue
@@ -329,19 +687,20 @@ class GEOAuditPipeline:
         item["images"] = images
         item["images_count"] = len(images)
 
-    def _extract_links(self, item, soup, base_url):
+    def _extract_links(self, item, tree, base_url):
         """Extract internal and external links."""
         try:
-            base_domain = urlparse(base_url).netloc.lower()
+            base_domain = urlsplit(base_url).netloc.lower()
         except Exception:
             base_domain = ""
+        subdomain_suffix = "." + base_domain
 
         internal_links = []
         external_links = []
 
-        for link in soup.find_all("a", href=True):
+        for link in LINKS_XPATH(tree):
             href = link.get("href", "")
-            anchor_text = link.get_text(strip=True)[:200]
+            anchor_text = element_text(link, strip=True)[:200]
 
             # Skip non-http links and anchors
             if href.startswith("#") or href.startswith("javascript:"):
@@ -350,19 +709,17 @@ class GEOAuditPipeline:
             # Determine if internal or external
             if href.startswith(("http://", "https://")):
                 try:
-                    link_domain = urlparse(href).netloc.lower()
+                    link_domain = urlsplit(href).netloc.lower()
                 except Exception:
                     continue
 
-                if link_domain == base_domain or link_domain.endswith("." + base_domain):
+                if link_domain == base_domain or link_domain.endswith(subdomain_suffix):
                     internal_links.append({
                         "url": href[:500],
                         "anchor_text": anchor_text,
                     })
                 else:
-                    rel = link.get("rel", [])
-                    if isinstance(rel, str):
-                        rel = [rel]
+                    rel = (link.get("rel") or "").split()
 
                     external_links.append({
                         "url": href[:500],
@@ -390,10 +747,14 @@ class MetadataExtractionPipeline:
     - meta_description: <meta name="description"> content
 
     Note: GEOAuditPipeline already handles these, so this is kept for
-    backward compatibility or standalone use.
+    backward compatibility or standalone use. Items it has already processed
+    are passed through without parsing the HTML again.
     """
 
     def process_item(self, item, spider):
+        if "meta_title" in item:
+            return item
+
         raw_html = item.get("raw_html", "")
 
         if not raw_html:
@@ -403,19 +764,19 @@ class MetadataExtractionPipeline:
             return item
 
         try:
-            soup = BeautifulSoup(raw_html, "lxml")
+            tree = parse_html_tree(raw_html)
 
             # Extract <title>
-            title_tag = soup.find("title")
-            item["meta_title"] = title_tag.get_text(strip=True) if title_tag else None
+            title_tag = TITLE_XPATH(tree)
+            item["meta_title"] = element_text(title_tag[0], strip=True) if title_tag else None
 
             # Extract first <h1>
-            h1_tag = soup.find("h1")
-            item["h1"] = h1_tag.get_text(strip=True) if h1_tag else None
+            h1_tag = H1_XPATH(tree)
+            item["h1"] = element_text(h1_tag[0], strip=True) if h1_tag else None
 
             # Extract <meta name="description">
-            meta_desc = soup.find("meta", attrs={"name": "description"})
-            item["meta_description"] = meta_desc.get("content", "").strip() if meta_desc else None
+            meta_desc = next((meta for meta in META_XPATH(tree) if meta.get("name") == "description"), None)
+            item["meta_description"] = (meta_desc.get("content") or "").strip() if meta_desc is not None else None
 
         except Exception as e:
             spider.logger.warning(f"Metadata extraction failed for {item.get('url')}: {e}")
@@ -430,35 +791,80 @@ class JsonOutputPipeline:
     """
     Output items as JSON Lines (one JSON object per line).
     Output file: output_{crawl_job_id}.jsonl
+
+    Items are handed to a background writer thread, which serializes them and
+    writes them in batches through a large buffer, so neither happens on the
+    reactor thread. The file is flushed when the buffer fills and when the
+    spider closes.
     """
 
+    BUFFER_SIZE = 1 << 20  # 1 MiB
+    BATCH_SIZE = 256
+
     def __init__(self):
         self.file = None
         self.output_path = None
+        self._queue = None
+        self._writer = None
 
     def open_spider(self, spider):
-        """Open output file when spider starts."""
+        """Open output file and start the writer thread when spider starts."""
         # Get crawl_job_id for unique filename
         job_id = getattr(spider, "crawl_job_id", "default")
         self.output_path = Path(f"output_{job_id}.jsonl")
 
         spider.logger.info(f"Opening output file: {self.output_path}")
-        self.file = open(self.output_path, "w", encoding="utf-8")
+        self.file = open(self.output_path, "wb", buffering=self.BUFFER_SIZE)
+
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._write_loop, args=(spider,), name="JsonOutputWriter", daemon=True,
+        )
+        self._writer.start()
 
     def close_spider(self, spider):
-        """Close output file when spider finishes."""
+        """Write the remaining items and close output file when spider finishes."""
+        if self._writer is not None:
+            self._queue.put(None)  # Sentinel: no more items
+            self._writer.join()
+            self._writer = None
         if self.file:
             self.file.close()
             spider.logger.info(f"Closed output file: {self.output_path}")
 
     def process_item(self, item, spider):
-        """Write item as JSON line."""
-        # Convert item to dict if needed
-        item_dict = dict(item) if hasattr(item, "items") else item
+        """Queue item to be written as a JSON line."""
+        # Convert item to dict if needed (the spider yields plain dicts,
+        # which are written as they are; this is the last pipeline)
+        item_dict = dict(item) if hasattr(item, "items") and not isinstance(item, dict) else item
 
-        # Write JSON line
-        line = json.dumps(item_dict, ensure_ascii=False, default=str)
-        self.file.write(line + "\n")
-        self.file.flush()
+        self._queue.put(item_dict)
 
         return item
+
+    def _write_loop(self, spider):
+        """Writer thread: serialize and write queued items until the sentinel."""
+        while True:
+            # Block for one item, then take whatever else is already queued
+            batch = [self._queue.get()]
+            while len(batch) < self.BATCH_SIZE and batch[-1] is not None:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines = []
+            for item_dict in batch:
+                if item_dict is None:
+                    continue
+                try:
+                    lines.append(json_line(item_dict))
+                except Exception as e:
+                    spider.logger.error(f"Failed to serialize {item_dict.get('url')}: {e}")
+            try:
+                self.file.writelines(lines)
+            except Exception as e:
+                spider.logger.error(f"Failed to write to {self.output_path}: {e}")
+
+            if batch[-1] is None:
+                return
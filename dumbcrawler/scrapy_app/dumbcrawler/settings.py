@@ -8,12 +8,20 @@ NEWSPIDER_MODULE = "dumbcrawler.spiders"
 # Crawl responsibly - disabled for dumb crawler
 ROBOTSTXT_OBEY = False
 
-# Configure maximum concurrent requests
-CONCURRENT_REQUESTS = 16
+# Configure maximum concurrent requests (Scrapy's per-domain default of 8
+# would otherwise cap single-site crawls)
+CONCURRENT_REQUESTS = 32
+CONCURRENT_REQUESTS_PER_DOMAIN = 16
+
+# DNS lookups run in the reactor thread pool
+REACTOR_THREADPOOL_MAXSIZE = 20
 
 # Download timeout in seconds
 DOWNLOAD_TIMEOUT = 30
 
+# Abort responses over 10 MB instead of downloading and auditing them
+DOWNLOAD_MAXSIZE = 10 * 1024 * 1024
+
 # Retry configuration
 RETRY_ENABLED = True
 RETRY_TIMES = 2
@@ -21,6 +29,15 @@ RETRY_TIMES = 2
 # Disable cookies for simplicity
 COOKIES_ENABLED = False
 
+# HTTP cache for re-audits and development (run_crawl.py --http-cache): pages
+# fetched within a day, and fresh per their caching headers, are served from
+# disk without the network or Playwright
+HTTPCACHE_ENABLED = False
+HTTPCACHE_STORAGE = "scrapy.extensions.httpcache.FilesystemCacheStorage"
+HTTPCACHE_POLICY = "scrapy.extensions.httpcache.RFC2616Policy"
+HTTPCACHE_EXPIRATION_SECS = 86400
+HTTPCACHE_GZIP = True
+
 # Set settings whose default value is deprecated to a future-proof value
 REQUEST_FINGERPRINTER_IMPLEMENTATION = "2.7"
 TWISTED_REACTOR = "twisted.internet.asyncioreactor.AsyncioSelectorReactor"
@@ -30,7 +47,8 @@ FEED_EXPORT_ENCODING = "utf-8"
 # PLAYWRIGHT CONFIGURATION
 # =============================================================================
 
-# Download handlers for Playwright
+# Download handlers for Playwright (run_crawl.py drops them for js_mode "off",
+# so no browser is launched for plain HTTP crawls)
 DOWNLOAD_HANDLERS = {
     "http": "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler",
     "https": "scrapy_playwright.handler.ScrapyPlaywrightDownloadHandler",
@@ -72,3 +90,20 @@ ITEM_PIPELINES = {
     "dumbcrawler.pipelines.GEOAuditPipeline": 300,
     "dumbcrawler.pipelines.JsonOutputPipeline": 800,
 }
+
+# Threads that run GEOAuditPipeline's per-page audit off the reactor thread
+# (0 = run inline). lxml parsing releases the GIL; the rest is pure Python.
+AUDIT_THREADS = 0
+
+# Replace raw_html with raw_html_sha256 once GEOAuditPipeline has extracted
+# everything from it, so the JSON Lines output carries no HTML
+DROP_RAW_HTML = False
+
+# With DROP_RAW_HTML, also keep each page's HTML gzipped in this directory,
+# content-addressed by raw_html_sha256 (ab/cd/<sha256>.html.gz), and record
+# the file in raw_html_path. None = keep only the hash.
+RAW_HTML_BLOB_DIR = None
+
+# Render markdown_content for each page (when disabled the field is left out
+# of the output, for consumers that only need the audit fields)
+MARKDOWN_CONTENT_ENABLED = True
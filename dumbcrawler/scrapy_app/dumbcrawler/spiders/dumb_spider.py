@@ -3,7 +3,105 @@ DumbSpider - Core spider for dumbcrawler
 Supports: single URL, list of URLs, and auto-discovery crawl modes
 """
 import scrapy
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse, urlsplit
+from lxml import etree
+from scrapy.utils.response import get_base_url
+from tldextract import TLDExtract
+from w3lib.url import canonicalize_url
+
+# Same query parsel builds for response.css("a::attr(href)"), compiled once;
+# plain str results so hrefs don't keep the page's tree alive
+LINK_HREFS_XPATH = etree.XPath("descendant-or-self::a/@href", smart_strings=False)
+
+# Public Suffix List lookups for the crawl's registrable domain, from the
+# snapshot bundled with tldextract (no network fetch at spider startup)
+DOMAIN_EXTRACTOR = TLDExtract(suffix_list_urls=(), include_psl_private_domains=True)
+
+# Whether to use Playwright for (start URLs, deeper pages) per js_mode:
+# 'auto' renders start URLs with Playwright and fetches deeper pages over HTTP
+PLAYWRIGHT_BY_JS_MODE = {
+    "off": (False, False),
+    "full": (True, True),
+    "auto": (True, False),
+}
+
+
+def _split_netloc_path(url: str) -> tuple:
+    """
+    (netloc, path) of url, as urlparse() gives them, sliced with str.find for
+    plain absolute http(s) URLs; anything else goes through urlparse.
+    """
+    scheme_end = url.find("://")
+    if (
+        scheme_end == -1
+        or url[:scheme_end].lower() not in ("http", "https")
+        or not url.isprintable()  # urlparse strips tabs/newlines
+    ):
+        parsed = urlparse(url)
+        return parsed.netloc, parsed.path
+
+    start = scheme_end + 3
+    netloc_end = len(url)
+    for delimiter in "/?#":
+        index = url.find(delimiter, start, netloc_end)
+        if index != -1:
+            netloc_end = index
+    path_end = len(url)
+    for delimiter in "?#":
+        index = url.find(delimiter, netloc_end, path_end)
+        if index != -1:
+            path_end = index
+    path = url[netloc_end:path_end]
+
+    # urlparse splits ";params" off the last path segment
+    params = path.find(";", path.rfind("/"))
+    if params != -1:
+        path = path[:params]
+    return url[start:netloc_end], path
+
+
+def _resolve_href(href: str, base_url: str, base_origin: str) -> str:
+    """
+    urljoin(base_url, href), by string concatenation for the common cases:
+    absolute http(s) hrefs and root-relative paths without dot segments
+    (base_origin is base_url's "scheme://netloc", or None to always join).
+    Hrefs urljoin would rewrite or reject (whitespace, ";params", IPv6
+    brackets, no host) still go through urljoin.
+    """
+    if (
+        " " in href or ";" in href or "[" in href or "]" in href
+        or not href.isprintable()
+    ):
+        return urljoin(base_url, href)
+    if href.startswith(("http://", "https://")):
+        netloc_start = href.index("//") + 2
+        if href[netloc_start:netloc_start + 1] not in ("", "/", "?", "#"):
+            return href
+    elif (
+        base_origin is not None
+        and href.startswith("/")
+        and not href.startswith("//")  # protocol-relative
+        and "/." not in href
+    ):
+        return base_origin + href
+    return urljoin(base_url, href)
+
+
+def _canonicalize(url: str) -> str:
+    """
+    Canonical form of url for dedup and scoping: w3lib's canonicalize_url
+    (lowercase host, sorted query, no fragment) minus default ports.
+    """
+    url = canonicalize_url(url)
+    for scheme, default_port in (("http://", ":80"), ("https://", ":443")):
+        if url.startswith(scheme):
+            netloc_end = url.find("/", len(scheme))
+            if netloc_end == -1:
+                netloc_end = len(url)
+            if url.endswith(default_port, 0, netloc_end):
+                url = url[:netloc_end - len(default_port)] + url[netloc_end:]
+            break
+    return url
 
 
 class DumbSpider(scrapy.Spider):
@@ -31,6 +129,13 @@ class DumbSpider(scrapy.Spider):
         self.max_depth = int(max_depth)
         self.js_mode = js_mode.lower()
 
+        # The Playwright decision only depends on js_mode and depth == 0
+        if self.js_mode not in PLAYWRIGHT_BY_JS_MODE:
+            self.logger.warning(f"Unknown js_mode '{self.js_mode}', defaulting to no Playwright")
+        self._playwright_at_start, self._playwright_deeper = PLAYWRIGHT_BY_JS_MODE.get(
+            self.js_mode, (False, False)
+        )
+
         # Parse boolean flags
         self.restrict_to_subdomain = restrict_to_subdomain.lower() == "true"
         self.restrict_to_path = restrict_to_path.lower() == "true"
@@ -42,28 +147,64 @@ class DumbSpider(scrapy.Spider):
             if url.strip()
         ]
 
-        # Initialize scoping variables from first start URL
+        # Initialize scoping variables from first start URL, canonicalized
+        # like the followed links they are compared with (lowercase host,
+        # no default port, percent-encoded path)
         if self.start_urls_list:
             first_url = self.start_urls_list[0]
-            parsed = urlparse(first_url)
+            parsed = urlparse(_canonicalize(first_url))
 
             # Full netloc (e.g., "blog.example.com")
-            self.allowed_netloc = parsed.netloc
-
-            # Base domain (e.g., "example.com" from "blog.example.com")
-            # Handle cases like "example.com" (no subdomain)
-            parts = parsed.netloc.split(".")
-            if len(parts) >= 2:
-                self.base_domain = ".".join(parts[-2:])
+            netloc = parsed.netloc
+            self.allowed_netloc = netloc
+
+            # Registrable domain (e.g., "example.co.uk" from
+            # "blog.example.co.uk"), keeping any port; hosts without a public
+            # suffix (localhost, IP addresses) are their own base domain
+            domain = DOMAIN_EXTRACTOR(netloc)
+            if domain.domain and domain.suffix:
+                host = netloc.rpartition("@")[2]
+                port = host[host.rfind(":"):] if ":" in host else ""
+                self.base_domain = f"{domain.domain}.{domain.suffix}{port}"
             else:
-                self.base_domain = parsed.netloc
-
-            # Path prefix for subfolder scoping (TASK 3E)
-            self.restrict_path_prefix = parsed.path.rstrip("/") + "/" if parsed.path else "/"
+                self.base_domain = netloc
         else:
             self.allowed_netloc = ""
             self.base_domain = ""
-            self.restrict_path_prefix = "/"
+
+        # Precomputed once for _check_url_scope, which runs for every link
+        self._dot_base_domain = "." + self.base_domain
+
+        # Subfolder scoping (TASK 3E) covers every start URL's path, on a path
+        # boundary: /blog matches /blog and /blog/post but not /blogger.
+        # Prefixes are a tuple so str.startswith tests them all in one call.
+        restrict_paths = dict.fromkeys(
+            urlparse(_canonicalize(url)).path.rstrip("/") for url in self.start_urls_list
+        ) or {"": None}
+        self._restrict_paths = frozenset(restrict_paths)
+        self._restrict_path_prefixes = tuple(path + "/" for path in restrict_paths)
+
+        # Request meta templates, copied per request; only depth and
+        # referrer_url vary
+        self._meta_template = {
+            "depth": 0,
+            "client_id": self.client_id,
+            "crawl_job_id": self.crawl_job_id,
+            "referrer_url": None,
+        }
+        self._playwright_meta_template = {
+            **self._meta_template,
+            "playwright": True,
+            "playwright_context": "default",
+            "playwright_include_page": False,
+        }
+
+        # Scope verdicts by URL: site-wide nav/footer links repeat on every page
+        self._url_allowed_cache = {}
+
+        # URLs already requested, so repeated links are skipped before a
+        # Request is built (Scrapy's dupefilter still has the final say)
+        self._seen_urls = {_canonicalize(url) for url in self.start_urls_list}
 
         # Log parsed configuration
         self.logger.info(f"=== DumbSpider Configuration ===")
@@ -77,7 +218,7 @@ class DumbSpider(scrapy.Spider):
         self.logger.info(f"  restrict_to_path: {self.restrict_to_path}")
         self.logger.info(f"  allowed_netloc: {self.allowed_netloc}")
         self.logger.info(f"  base_domain: {self.base_domain}")
-        self.logger.info(f"  restrict_path_prefix: {self.restrict_path_prefix}")
+        self.logger.info(f"  restrict_path_prefixes: {self._restrict_path_prefixes}")
 
     def start_requests(self):
         """Generate initial requests for all start URLs."""
@@ -97,19 +238,8 @@ class DumbSpider(scrapy.Spider):
         Returns:
             True if Playwright should be used, False otherwise
         """
-        if self.js_mode == "off":
-            return False
-
-        if self.js_mode == "full":
-            return True
-
-        # 'auto' mode: use Playwright for depth 0 (start URLs), plain HTTP for deeper
-        if self.js_mode == "auto":
-            return depth == 0
-
-        # Default to no Playwright for unknown modes
-        self.logger.warning(f"Unknown js_mode '{self.js_mode}', defaulting to no Playwright")
-        return False
+        # Precomputed from js_mode in __init__ (see PLAYWRIGHT_BY_JS_MODE)
+        return self._playwright_at_start if depth == 0 else self._playwright_deeper
 
     def _make_request(self, url: str, depth: int, referrer: str = None):
         """
@@ -123,23 +253,17 @@ class DumbSpider(scrapy.Spider):
         Returns:
             scrapy.Request configured with metadata
         """
-        meta = {
-            "depth": depth,
-            "client_id": self.client_id,
-            "crawl_job_id": self.crawl_job_id,
-            "referrer_url": referrer,
-        }
-
         # Decide whether to use Playwright
-        use_playwright = self._should_use_playwright(url, depth)
+        use_playwright = self._playwright_at_start if depth == 0 else self._playwright_deeper
 
         if use_playwright:
-            meta["playwright"] = True
-            meta["playwright_context"] = "default"
-            meta["playwright_include_page"] = False
-            self.logger.debug(f"Request with Playwright: {url} (depth={depth})")
+            meta = self._playwright_meta_template.copy()
+            self.logger.debug("Request with Playwright: %s (depth=%s)", url, depth)
         else:
-            self.logger.debug(f"Request without Playwright: {url} (depth={depth})")
+            meta = self._meta_template.copy()
+            self.logger.debug("Request without Playwright: %s (depth=%s)", url, depth)
+        meta["depth"] = depth
+        meta["referrer_url"] = referrer
 
         return scrapy.Request(
             url=url,
@@ -166,7 +290,7 @@ class DumbSpider(scrapy.Spider):
         referrer = response.meta.get("referrer_url")
 
         self.logger.info(
-            f"Parsing: {response.url} (status={response.status}, depth={depth})"
+            "Parsing: %s (status=%s, depth=%s)", response.url, response.status, depth
         )
 
         # Yield item for this page (structure defined in TASK 4A)
@@ -184,35 +308,59 @@ class DumbSpider(scrapy.Spider):
 
         # Only follow links in 'crawl' mode
         if self.mode != "crawl":
-            self.logger.debug(f"Mode is '{self.mode}', not following links")
+            self.logger.debug("Mode is '%s', not following links", self.mode)
             return
 
         # Check depth limit
         if depth >= self.max_depth:
-            self.logger.debug(f"Max depth ({self.max_depth}) reached, not following links")
+            self.logger.debug("Max depth (%s) reached, not following links", self.max_depth)
             return
 
         # Extract and follow links
-        links = response.css("a::attr(href)").getall()
-        self.logger.info(f"Found {len(links)} links on {response.url}")
-
-        for href in links:
+        links = LINK_HREFS_XPATH(response.selector.root)
+        self.logger.info("Found %d links on %s", len(links), response.url)
+
+        # What response.urljoin() resolves against (honours <base href>)
+        base_url = get_base_url(response)
+        base_origin = None
+        if base_url.startswith(("http://", "https://")):
+            base_parts = urlsplit(base_url)
+            base_origin = f"{base_parts.scheme}://{base_parts.netloc}"
+
+        # Loop-invariant lookups hoisted out of the per-link body
+        is_url_allowed = self._is_url_allowed
+        seen_urls = self._seen_urls
+        make_request = self._make_request
+        next_depth = depth + 1
+        page_url = response.url
+
+        # Repeated hrefs (nav, footer, "read more") are dropped in C by
+        # dict.fromkeys, keeping first-seen order, before the Python loop
+        for href in dict.fromkeys(links):
             # Resolve relative URLs
-            next_url = response.urljoin(href)
+            next_url = _resolve_href(href, base_url, base_origin)
 
             # Skip non-HTTP(S) URLs
             if not next_url.startswith(('http://', 'https://')):
                 continue
 
+            # One spelling per page for the scope check, dedup and request
+            next_url = _canonicalize(next_url)
+
             # Apply scoping rules
-            if not self._is_url_allowed(next_url):
+            if not is_url_allowed(next_url):
                 continue
 
-            yield self._make_request(next_url, depth=depth + 1, referrer=response.url)
+            # Skip links already requested from this or an earlier page
+            if next_url in seen_urls:
+                continue
+            seen_urls.add(next_url)
+
+            yield make_request(next_url, depth=next_depth, referrer=page_url)
 
     def _is_url_allowed(self, url: str) -> bool:
         """
-        Check if URL is within allowed scope.
+        Check if URL is within allowed scope, memoized per URL.
 
         Args:
             url: URL to check
@@ -220,40 +368,54 @@ class DumbSpider(scrapy.Spider):
         Returns:
             True if URL is allowed, False otherwise
         """
-        parsed = urlparse(url)
-        target_netloc = parsed.netloc
-        target_path = parsed.path or "/"
+        allowed = self._url_allowed_cache.get(url)
+        if allowed is None:
+            allowed = self._url_allowed_cache[url] = self._check_url_scope(url)
+        return allowed
+
+    def _check_url_scope(self, url: str) -> bool:
+        """Scope check behind _is_url_allowed (logs why a URL is rejected)."""
+        target_netloc, target_path = _split_netloc_path(url)
+        target_path = target_path or "/"
 
         # Domain/subdomain check
         if self.restrict_to_subdomain:
             # Exact subdomain match required
             if target_netloc != self.allowed_netloc:
-                self.logger.debug(f"Rejected (subdomain mismatch): {url}")
+                self.logger.debug("Rejected (subdomain mismatch): %s", url)
                 return False
         else:
-            # Same base domain required
-            if not target_netloc.endswith(self.base_domain):
-                self.logger.debug(f"Rejected (domain mismatch): {url}")
+            # Same base domain or one of its subdomains required
+            # (a bare endswith would also accept e.g. "notexample.com")
+            if (
+                target_netloc != self.base_domain
+                and not target_netloc.endswith(self._dot_base_domain)
+            ):
+                self.logger.debug("Rejected (domain mismatch): %s", url)
                 return False
 
         # Path prefix check
         if self.restrict_to_path:
-            if not target_path.startswith(self.restrict_path_prefix.rstrip("/")):
-                self.logger.debug(f"Rejected (path mismatch): {url}")
+            if (
+                target_path.rstrip("/") not in self._restrict_paths
+                and not target_path.startswith(self._restrict_path_prefixes)
+            ):
+                self.logger.debug("Rejected (path mismatch): %s", url)
                 return False
 
         return True
 
     def _headers_to_dict(self, headers) -> dict:
-        """Convert Scrapy Headers object to a plain dict."""
-        result = {}
-        for key, values in headers.items():
-            # Decode bytes to string
-            key_str = key.decode('utf-8') if isinstance(key, bytes) else key
-            # Headers can have multiple values
-            decoded_values = [
-                v.decode('utf-8') if isinstance(v, bytes) else v
-                for v in values
-            ]
-            result[key_str] = decoded_values[0] if len(decoded_values) == 1 else decoded_values
-        return result
+        """
+        Convert Scrapy Headers object to a plain dict.
+
+        Headers stores normalized bytes keys and lists of bytes values; a
+        repeated header (e.g. Set-Cookie) keeps its values as a list.
+        """
+        return {
+            key.decode("utf-8"): (
+                values[0].decode("utf-8") if len(values) == 1
+                else [value.decode("utf-8") for value in values]
+            )
+            for key, values in headers.items()
+        }
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Test script for DumbSpider link scoping.
+
+Checks that links followed in crawl mode are compared with scope values
+built the same way as the links themselves (canonical host, port and path).
+
+Usage:
+    python test_dumb_spider_scope.py
+"""
+
+import sys
+import os
+
+# Set UTF-8 encoding for Windows console
+if sys.platform == 'win32':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# Add the scrapy_app directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'scrapy_app'))
+
+
+def _followed_urls(spider, page_url, links):
+    """URLs of the requests DumbSpider.parse() yields for a page with these links."""
+    from scrapy.http import HtmlResponse, Request
+
+    body = "<html><body>" + "".join(f'<a href="{href}">link</a>' for href in links) + "</body></html>"
+    request = Request(page_url, meta={"depth": 0})
+    response = HtmlResponse(page_url, body=body.encode("utf-8"), encoding="utf-8", request=request)
+    return [result.url for result in spider.parse(response) if isinstance(result, Request)]
+
+
+def _check_followed(spider, page_url, links, expected):
+    """Compare the followed URLs with expected and print the outcome."""
+    followed = _followed_urls(spider, page_url, links)
+    if followed == expected:
+        print(f"✓ {page_url}: followed {followed}")
+        return True
+    print(f"✗ {page_url}: followed {followed} (expected {expected})")
+    return False
+
+
+def test_default_port_start_url():
+    """Test that a start URL with an explicit default port still follows its links."""
+    print("=" * 60)
+    print("TEST 1: Start URL With Default Port")
+    print("=" * 60)
+
+    from dumbcrawler.spiders.dumb_spider import DumbSpider
+
+    # (start URL, links on it, links expected to be followed); the :8080 link
+    # is another origin and stays out of scope
+    cases = [
+        (
+            "https://example.com:443/",
+            ["/a", "https://example.com/b", "https://example.com:8080/c"],
+            ["https://example.com/a", "https://example.com/b"],
+        ),
+        (
+            "http://example.com:80/blog/",
+            ["/blog/a", "http://example.com/blog/b", "http://example.com:8080/blog/c"],
+            ["http://example.com/blog/a", "http://example.com/blog/b"],
+        ),
+    ]
+    for start_url, links, expected in cases:
+        for restrict_to_subdomain in ("true", "false"):
+            spider = DumbSpider(
+                mode="crawl",
+                start_urls=start_url,
+                max_depth=2,
+                js_mode="off",
+                restrict_to_subdomain=restrict_to_subdomain,
+                restrict_to_path="true",
+            )
+            if not _check_followed(spider, start_url, links, expected):
+                return False
+
+    print("\n✓ Default port start URLs follow their links\n")
+    return True
+
+
+def test_mixed_case_start_url():
+    """Test that a start URL with a mixed-case host matches lowercase links."""
+    print("=" * 60)
+    print("TEST 2: Start URL With Mixed-Case Host")
+    print("=" * 60)
+
+    from dumbcrawler.spiders.dumb_spider import DumbSpider
+
+    spider = DumbSpider(
+        mode="crawl",
+        start_urls="https://Blog.Example.COM/docs/",
+        max_depth=2,
+        js_mode="off",
+        restrict_to_subdomain="true",
+        restrict_to_path="true",
+    )
+    links = [
+        "/docs/intro",
+        "https://blog.example.com/docs/setup",
+        "HTTPS://BLOG.EXAMPLE.COM/docs/faq",
+        "https://blog.example.com/pricing",
+        "https://www.example.com/docs/other",
+    ]
+    expected = [
+        "https://blog.example.com/docs/intro",
+        "https://blog.example.com/docs/setup",
+        "https://blog.example.com/docs/faq",
+    ]
+    if not _check_followed(spider, "https://blog.example.com/docs/", links, expected):
+        return False
+
+    print("\n✓ Mixed-case start URLs follow their links\n")
+    return True
+
+
+def test_path_prefix_boundary():
+    """Test that restrict_to_path covers every start URL's path, on path boundaries."""
+    print("=" * 60)
+    print("TEST 3: Path Prefixes On Path Boundaries")
+    print("=" * 60)
+
+    from dumbcrawler.spiders.dumb_spider import DumbSpider
+
+    spider = DumbSpider(
+        mode="crawl",
+        start_urls="https://example.com/blog/,https://example.com/docs/v2",
+        max_depth=2,
+        js_mode="off",
+        restrict_to_path="true",
+    )
+    links = ["/blog", "/blog/post", "/blogger", "/docs/v2/setup", "/docs/v20", "/docs/v1"]
+    expected = [
+        "https://example.com/blog",
+        "https://example.com/blog/post",
+        "https://example.com/docs/v2/setup",
+    ]
+    if not _check_followed(spider, "https://example.com/blog/", links, expected):
+        return False
+
+    print("\n✓ Path prefixes match on path boundaries\n")
+    return True
+
+
+def run_all_tests():
+    """Run all tests and report results."""
+    print("\n" + "=" * 60)
+    print("DUMBSPIDER SCOPE TEST SUITE")
+    print("=" * 60 + "\n")
+
+    tests = [
+        ("Default Port Test", test_default_port_start_url),
+        ("Mixed-Case Host Test", test_mixed_case_start_url),
+        ("Path Boundary Test", test_path_prefix_boundary),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_name, test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+            else:
+                failed += 1
+                print(f"FAILED: {test_name}\n")
+        except Exception as e:
+            failed += 1
+            print(f"ERROR in {test_name}: {e}\n")
+
+    print("\n" + "=" * 60)
+    print("TEST RESULTS")
+    print("=" * 60)
+    print(f"Passed: {passed}/{len(tests)}")
+    print(f"Failed: {failed}/{len(tests)}")
+
+    if failed == 0:
+        print("\n✓ ALL TESTS PASSED!")
+        return 0
+    else:
+        print(f"\n✗ {failed} TEST(S) FAILED.")
+        return 1
+
+
+if __name__ == '__main__':
+    exit_code = run_all_tests()
+    sys.exit(exit_code)